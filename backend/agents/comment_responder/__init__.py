@@ -3,10 +3,11 @@
 """Comment responder agent for generating replies to social media comments."""
 
 from .runner import run_comment_responder, run_comment_responder_all_assets
-from .comment_responder_agent import CommentResponderAgent
+from .comment_responder_agent import CommentResponderAgent, get_comment_responder_agent
 
 __all__ = [
     "run_comment_responder",
     "run_comment_responder_all_assets",
-    "CommentResponderAgent"
+    "CommentResponderAgent",
+    "get_comment_responder_agent"
 ]
@@ -2,8 +2,10 @@
 
 """Comment responder agent for generating replies to social media comments."""
 
+import asyncio
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -16,6 +18,53 @@ from backend.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Obvious spam patterns, matched case-insensitively in a single pass
+SPAM_INDICATORS = [
+    "http://",
+    "https://",
+    "click here",
+    "buy now",
+    "free money",
+    "www.",
+]
+SPAM_PATTERN = re.compile(
+    "|".join(re.escape(indicator) for indicator in SPAM_INDICATORS),
+    re.IGNORECASE
+)
+
+# Graph API field names that differ between platforms
+PLATFORM_FIELDS = {
+    "facebook": {
+        "post_text": "message",
+        "post_url": "permalink_url",
+        "comment_text": "message",
+    },
+    "instagram": {
+        "post_text": "caption",
+        "post_url": "permalink",
+        "comment_text": "text",
+    },
+}
+
+# Number of other comments on the post included in the prompt
+OTHER_COMMENTS_SAMPLE_SIZE = 5
+
+# Shorter generations are treated as empty/unusable
+MIN_RESPONSE_LENGTH = 5
+
+# Agent-specific instructions, read once per process
+AGENT_PROMPT = (Path(__file__).parent / "prompts" / "comment_responder.txt").read_text()
+
+
+def is_spam(comment_text: str) -> bool:
+    """Return True if the comment text contains a spam indicator."""
+    return SPAM_PATTERN.search(comment_text) is not None
+
+
+def _truncate(text: Optional[str], max_length: int) -> str:
+    """Return text cut to max_length characters, treating None as empty."""
+    return (text or "")[:max_length]
+
 
 class CommentResponderAgent:
     """
@@ -33,9 +82,9 @@ class CommentResponderAgent:
         self.comment_ops = CommentOperations(business_asset_id)
 
         # Load prompts
-        prompt_path = Path(__file__).parent / "prompts" / "comment_responder.txt"
-        self.agent_prompt = prompt_path.read_text()
+        self.agent_prompt = AGENT_PROMPT
         self.global_prompt = get_global_system_prompt(self.business_asset_id)
+        self.system_message = f"{self.global_prompt}\n\n{self.agent_prompt}"
 
         # Initialize LLM
         self.llm = ChatOpenAI(
@@ -47,6 +96,13 @@ class CommentResponderAgent:
         # Output parser
         self.output_parser = StrOutputParser()
 
+        # Chain is built once; per-comment text is passed in as variables
+        self.prompt_template = ChatPromptTemplate.from_messages([
+            ("system", "{system}"),
+            ("human", "{user}")
+        ])
+        self.chain = self.prompt_template | self.llm | self.output_parser
+
     async def generate_response(
         self,
         comment: PlatformComment
@@ -63,115 +119,177 @@ class CommentResponderAgent:
         Raises:
             Exception: If response generation fails
         """
-        logger.info(
+        try:
+            prompt_inputs = await self.prepare(comment)
+            if prompt_inputs is None:
+                return None
+
+            # Generate response using LangChain
+            response = await self.chain.ainvoke(prompt_inputs)
+
+            return self.postprocess(comment, response)
+
+        except Exception as e:
+            logger.error(
+                "Failed to generate response",
+                comment_id=comment.comment_id,
+                error=str(e)
+            )
+            raise
+
+    async def prepare(
+        self,
+        comment: PlatformComment,
+        post_cache: Optional[Dict[Tuple[str, str], Tuple[Any, Any]]] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        Gather context and build the prompt for a comment.
+
+        This is the I/O half of response generation; the runner calls it for
+        every pending comment up-front so the LLM calls can be batched.
+
+        Args:
+            comment: PlatformComment instance with all comment details
+            post_cache: Optional prefetched (post_context, all_comments) results
+                keyed by (platform, post_id); see _gather_context
+
+        Returns:
+            Inputs for self.chain, or None if we should not respond
+        """
+        logger.debug(
             "Generating response for comment",
             comment_id=comment.comment_id,
             platform=comment.platform
         )
 
-        try:
-            # Gather context
-            context = await self._gather_context(comment)
+        # Filter spam on the comment text alone, before any API calls
+        if self._is_spam(comment):
+            logger.debug(
+                "Skipping response (filtered)",
+                comment_id=comment.comment_id
+            )
+            return None
 
-            # Check if we should respond (e.g., filter spam)
-            if not self._should_respond(comment, context):
-                logger.info(
-                    "Skipping response (filtered)",
-                    comment_id=comment.comment_id
-                )
-                return None
+        # Gather context
+        context = await self._gather_context(comment, post_cache)
 
-            # Build prompt
-            prompt = self._build_prompt(comment, context)
+        if not self._comment_still_exists(comment, context):
+            logger.debug(
+                "Skipping response (filtered)",
+                comment_id=comment.comment_id
+            )
+            return None
 
-            # Generate response using LangChain
-            chain = prompt | self.llm | self.output_parser
-            response = await chain.ainvoke({})
+        return self._build_prompt(comment, context)
 
-            # Clean and validate response
-            response = response.strip()
+    def postprocess(
+        self,
+        comment: PlatformComment,
+        response: str
+    ) -> Optional[str]:
+        """
+        Clean and validate raw LLM output for a comment.
 
-            if not response or len(response) < 5:
-                logger.warning(
-                    "Generated response too short or empty",
-                    comment_id=comment.comment_id
-                )
-                return None
+        Args:
+            comment: The comment the response was generated for
+            response: Raw text returned by the LLM
 
-            logger.info(
-                "Generated response successfully",
-                comment_id=comment.comment_id,
-                response_length=len(response)
+        Returns:
+            Cleaned response text, or None if the response is unusable
+        """
+        response = response.strip()
+
+        if len(response) < MIN_RESPONSE_LENGTH:
+            logger.warning(
+                "Generated response too short or empty",
+                comment_id=comment.comment_id
             )
+            return None
 
-            return response
+        logger.debug(
+            "Generated response successfully",
+            comment_id=comment.comment_id,
+            response_length=len(response)
+        )
 
-        except Exception as e:
-            logger.error(
-                "Failed to generate response",
-                comment_id=comment.comment_id,
-                error=str(e)
-            )
-            raise
+        return response
 
     async def _gather_context(
         self,
-        comment: PlatformComment
+        comment: PlatformComment,
+        post_cache: Optional[Dict[Tuple[str, str], Tuple[Any, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Gather all necessary context for response generation.
 
         Args:
             comment: The comment we're responding to
+            post_cache: Optional prefetched (post_context, all_comments) results
+                keyed by (platform, post_id). Entries may hold the exception a
+                fetch raised. Posts missing from the cache are fetched here.
 
         Returns:
             Dictionary with post context, comment details, and other comments
         """
-        logger.info(
+        logger.debug(
             "Gathering context for comment",
             comment_id=comment.comment_id,
             post_id=comment.post_id
         )
 
-        # Fetch post/media context
-        try:
-            post_context = await self.comment_ops.get_post_context(
-                platform=comment.platform,
-                post_id=comment.post_id
+        cached = post_cache.get((comment.platform, comment.post_id)) if post_cache else None
+
+        if cached is None:
+            # Fetch post context, all comments on the post, and the current
+            # comment (to verify it still exists) concurrently
+            post_context, all_comments, current_comment = await asyncio.gather(
+                self.comment_ops.get_post_context(
+                    platform=comment.platform,
+                    post_id=comment.post_id
+                ),
+                self.comment_ops.get_all_comments(
+                    platform=comment.platform,
+                    post_id=comment.post_id,
+                    limit=OTHER_COMMENTS_SAMPLE_SIZE
+                ),
+                self.comment_ops.get_comment_details(
+                    platform=comment.platform,
+                    comment_id=comment.comment_id
+                ),
+                return_exceptions=True
             )
-        except Exception as e:
+        else:
+            # Post-level context was already fetched for this run
+            post_context, all_comments = cached
+            try:
+                current_comment = await self.comment_ops.get_comment_details(
+                    platform=comment.platform,
+                    comment_id=comment.comment_id
+                )
+            except Exception as e:
+                current_comment = e
+
+        if isinstance(post_context, Exception):
             logger.error(
                 "Failed to fetch post context",
                 post_id=comment.post_id,
-                error=str(e)
+                error=str(post_context)
             )
             post_context = {}
 
-        # Fetch all comments on this post
-        try:
-            all_comments = await self.comment_ops.get_all_comments(
-                platform=comment.platform,
-                post_id=comment.post_id
-            )
-        except Exception as e:
+        if isinstance(all_comments, Exception):
             logger.error(
                 "Failed to fetch other comments",
                 post_id=comment.post_id,
-                error=str(e)
+                error=str(all_comments)
             )
             all_comments = []
 
-        # Verify the comment still exists
-        try:
-            current_comment = await self.comment_ops.get_comment_details(
-                platform=comment.platform,
-                comment_id=comment.comment_id
-            )
-        except Exception as e:
+        if isinstance(current_comment, Exception):
             logger.warning(
                 "Could not verify comment existence",
                 comment_id=comment.comment_id,
-                error=str(e)
+                error=str(current_comment)
             )
             current_comment = None
 
@@ -185,7 +303,7 @@ class CommentResponderAgent:
             }
         }
 
-        logger.info(
+        logger.debug(
             "Context gathered successfully",
             comment_id=comment.comment_id,
             has_post_context=bool(post_context),
@@ -194,46 +312,41 @@ class CommentResponderAgent:
 
         return context
 
-    def _should_respond(
+    def _is_spam(self, comment: PlatformComment) -> bool:
+        """
+        Determine if a comment looks like spam.
+
+        Only inspects the comment text, so it can run before any context is
+        fetched.
+
+        Args:
+            comment: The comment to check
+
+        Returns:
+            True if the comment matches a spam indicator, False otherwise
+        """
+        # Basic spam filter (very simple for now)
+        if is_spam(comment.comment_text):
+            logger.info("Comment marked as potential spam", comment_id=comment.comment_id)
+            return True
+
+        return False
+
+    def _comment_still_exists(
         self,
         comment: PlatformComment,
         context: Dict[str, Any]
     ) -> bool:
         """
-        Determine if we should respond to this comment.
-
-        Filters out spam, inappropriate content, etc.
+        Determine if the comment still exists on the platform.
 
         Args:
             comment: The comment to check
             context: Gathered context
 
         Returns:
-            True if we should respond, False otherwise
+            True if the comment still exists, False otherwise
         """
-        # Basic spam filter (very simple for now)
-        text = comment.comment_text.lower()
-
-        # Filter obvious spam patterns
-        spam_indicators = [
-            "http://",
-            "https://",
-            "click here",
-            "buy now",
-            "free money",
-            "www.",
-        ]
-
-        for indicator in spam_indicators:
-            if indicator in text:
-                logger.info(
-                    "Comment marked as potential spam",
-                    comment_id=comment.comment_id,
-                    indicator=indicator
-                )
-                return False
-
-        # Verify comment still exists
         if not context.get("current_comment"):
             logger.info(
                 "Comment no longer exists",
@@ -247,7 +360,7 @@ class CommentResponderAgent:
         self,
         comment: PlatformComment,
         context: Dict[str, Any]
-    ) -> ChatPromptTemplate:
+    ) -> Dict[str, str]:
         """
         Build the prompt for response generation.
 
@@ -256,26 +369,31 @@ class CommentResponderAgent:
             context: Gathered context
 
         Returns:
-            ChatPromptTemplate ready for invocation
+            Dictionary with "system" and "user" messages for self.chain
         """
         post_context = context.get("post_context", {})
         all_comments = context.get("all_comments", [])
         current_comment = context.get("current_comment", {})
 
         # Extract post details
+        fields = PLATFORM_FIELDS[comment.platform]
+        post_text = _truncate(post_context.get(fields["post_text"]), 500)
+        post_url = post_context.get(fields["post_url"], "")
         if comment.platform == "facebook":
-            post_text = post_context.get("message", "")
-            post_url = post_context.get("permalink_url", "")
+            total_comments = post_context.get("comments", {}).get("summary", {}).get("total_count")
         else:  # Instagram
-            post_text = post_context.get("caption", "")
-            post_url = post_context.get("permalink", "")
+            total_comments = post_context.get("comments_count")
+
+        # Only a sample of comments is fetched; prefer the post's own total
+        if total_comments is None:
+            total_comments = len(all_comments)
 
-        # Build context string
-        context_str = f"""
+        # Build the user message as a list of parts joined once at the end
+        parts: List[str] = [f"""
 ## Original Post
 
 Platform: {comment.platform.upper()}
-Caption: {post_text[:500] if post_text else "N/A"}
+Caption: {post_text or "N/A"}
 URL: {post_url}
 
 ## Comment to Respond To
@@ -287,26 +405,26 @@ Likes: {comment.like_count}
 
 ## Other Comments on This Post
 
-Total Comments: {len(all_comments)}
-"""
+Total Comments: {total_comments}
+"""]
 
         # Add sample of other comments for context (limit to avoid token overflow)
         if all_comments:
-            context_str += "\nRecent Comments:\n"
-            for i, other_comment in enumerate(all_comments[:5]):
-                # Get comment text (field name differs by platform)
-                if comment.platform == "facebook":
-                    other_text = other_comment.get("message", "")
-                else:
-                    other_text = other_comment.get("text", "")
-
-                other_username = other_comment.get("username", other_comment.get("from", {}).get("name", "Unknown"))
-                context_str += f"{i+1}. @{other_username}: {other_text[:100]}...\n"
-
-        # Build the full prompt
-        system_message = f"{self.global_prompt}\n\n{self.agent_prompt}"
+            comment_text_field = fields["comment_text"]
+            samples = [
+                (
+                    other_comment.get("username", other_comment.get("from", {}).get("name", "Unknown")),
+                    _truncate(other_comment.get(comment_text_field), 100)
+                )
+                for other_comment in all_comments[:OTHER_COMMENTS_SAMPLE_SIZE]
+            ]
+            parts.append("\nRecent Comments:\n")
+            parts.extend(
+                f"{i}. @{username}: {text}...\n"
+                for i, (username, text) in enumerate(samples, start=1)
+            )
 
-        user_message = f"""{context_str}
+        parts.append(f"""
 
 ## Your Task
 
@@ -319,11 +437,30 @@ Remember to:
 - Stay on-brand and contextually relevant
 
 Generate ONLY the response text (no explanations or meta-commentary).
-"""
+""")
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", user_message)
-        ])
+        return {"system": self.system_message, "user": "".join(parts)}
+
+
+# Per-process cache of agents keyed by business asset ID
+_AGENT_CACHE: Dict[str, CommentResponderAgent] = {}
 
-        return prompt
+
+def get_comment_responder_agent(business_asset_id: str) -> CommentResponderAgent:
+    """
+    Get the comment responder agent for a business asset.
+
+    Agents are created on first use and reused afterwards, so repeated runs
+    in the same process skip prompt loading and LLM client construction.
+
+    Args:
+        business_asset_id: Business asset ID for multi-tenancy
+
+    Returns:
+        Cached CommentResponderAgent instance
+    """
+    agent = _AGENT_CACHE.get(business_asset_id)
+    if agent is None:
+        agent = CommentResponderAgent(business_asset_id)
+        _AGENT_CACHE[business_asset_id] = agent
+    return agent
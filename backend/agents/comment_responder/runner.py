@@ -2,11 +2,18 @@
 
 """Runner for the comment responder agent with multi-page support and Instagram comment fetching."""
 
-from typing import Dict, Any, List, Optional
-from backend.agents.comment_responder.comment_responder_agent import CommentResponderAgent
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, Union
+from backend.agents.comment_responder.comment_responder_agent import (
+    OTHER_COMMENTS_SAMPLE_SIZE,
+    get_comment_responder_agent,
+    is_spam,
+)
 from backend.database.repositories.platform_comments import PlatformCommentRepository
 from backend.database.repositories.business_assets import BusinessAssetRepository
-from backend.services.meta import CommentOperations, check_instagram_comments
+from backend.models import PlatformComment
+from backend.services.meta import check_instagram_comments
 from backend.utils import get_logger
 
 logger = get_logger(__name__)
@@ -21,25 +28,40 @@ class CommentResponderRunner:
     Instagram (via periodic polling).
     """
 
-    def __init__(self, business_asset_id: str, max_comments_per_run: int = 10):
+    def __init__(
+        self,
+        business_asset_id: str,
+        max_comments_per_run: int = 10,
+        max_concurrency: int = 8
+    ):
         """
         Initialize the runner.
 
         Args:
             business_asset_id: Business asset ID for multi-tenancy
             max_comments_per_run: Maximum number of comments to process in one run
+            max_concurrency: Maximum number of comments handled concurrently
+                (bounds Meta API and OpenAI request rates)
         """
         self.business_asset_id = business_asset_id
         self.max_comments_per_run = max_comments_per_run
-        self.agent = CommentResponderAgent(business_asset_id)
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # (platform, post_id) -> (post_context, all_comments), scoped to one run
+        self._post_cache: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        # Ignored and failed outcomes collected during a run, written in one batch
+        self._status_updates: List[Dict[str, Any]] = []
+        self.agent = get_comment_responder_agent(business_asset_id)
         self.comment_repo = PlatformCommentRepository()
-        self.comment_ops = CommentOperations(business_asset_id)
+        # Share the agent's client so context fetches and replies use one session
+        self.comment_ops = self.agent.comment_ops
 
     async def run(
         self,
         platform: str = None,
         limit: int = None,
-        fetch_instagram_first: bool = True
+        fetch_instagram_first: bool = True,
+        pending_comments: Optional[List[PlatformComment]] = None
     ) -> Dict[str, Any]:
         """
         Run the comment responder for pending comments.
@@ -48,6 +70,8 @@ class CommentResponderRunner:
             platform: Optional platform filter ("facebook" or "instagram")
             limit: Optional limit override
             fetch_instagram_first: Whether to fetch new Instagram comments before processing
+            pending_comments: Optional pre-fetched pending comments; when given,
+                the pending-comments query is skipped
 
         Returns:
             Dictionary with results summary
@@ -74,37 +98,15 @@ class CommentResponderRunner:
 
         # Fetch new Instagram comments if requested and not filtering to Facebook only
         if fetch_instagram_first and platform != "facebook":
-            try:
-                instagram_results = await check_instagram_comments(
-                    business_asset_id=self.business_asset_id
-                )
-                results["instagram_fetch"] = {
-                    "success": instagram_results.get("success", False),
-                    "new_comments": instagram_results.get("new_comments_added", 0),
-                    "media_checked": instagram_results.get("media_checked", 0)
-                }
-                logger.info(
-                    "Instagram comment fetch completed",
-                    business_asset_id=self.business_asset_id,
-                    new_comments=results["instagram_fetch"]["new_comments"]
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch Instagram comments",
-                    business_asset_id=self.business_asset_id,
-                    error=str(e)
-                )
-                results["instagram_fetch"] = {
-                    "success": False,
-                    "error": str(e)
-                }
+            results["instagram_fetch"] = await fetch_instagram_comments(self.business_asset_id)
 
-        # Get pending comments
-        pending_comments = await self.comment_repo.get_pending_comments(
-            business_asset_id=self.business_asset_id,
-            platform=platform,
-            limit=limit
-        )
+        # Get pending comments unless the caller already fetched them
+        if pending_comments is None:
+            pending_comments = await self.comment_repo.get_pending_comments(
+                business_asset_id=self.business_asset_id,
+                platform=platform,
+                limit=limit
+            )
 
         if not pending_comments:
             logger.info(
@@ -118,10 +120,109 @@ class CommentResponderRunner:
             business_asset_id=self.business_asset_id
         )
 
-        # Process each comment
-        for comment in pending_comments:
+        # Reuse one HTTP session for all Meta API calls in this run
+        async with self.comment_ops.shared_session():
+            await self._respond_to_comments(pending_comments, results)
+
+        results["success"] = results["processed"] > 0
+
+        logger.info(
+            "Comment responder run completed",
+            **{k: v for k, v in results.items() if k not in ["errors", "instagram_fetch"]}
+        )
+
+        return results
+
+    async def _respond_to_comments(
+        self,
+        pending_comments: List[Any],
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Generate and post responses for a batch of pending comments.
+
+        Args:
+            pending_comments: PlatformComment instances to process
+            results: Results dictionary to update
+        """
+        # Fetch post-level context once per unique post, then gather the
+        # remaining context and build prompts for every comment up-front
+        await self._prefetch_posts(pending_comments)
+        prepared = await asyncio.gather(
+            *[self._prepare_comment(comment) for comment in pending_comments],
+            return_exceptions=True
+        )
+
+        # Replies are posted by background workers as soon as each response
+        # is ready, so Meta API writes overlap with the remaining generations.
+        # Counter updates on `results` never span an await, so the workers can
+        # share it without a lock.
+        reply_queue: asyncio.Queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._reply_worker(reply_queue, results))
+            for _ in range(self.max_concurrency)
+        ]
+
+        try:
+            # Comments that were filtered or failed preparation need no generation
+            to_generate = []
+            for i, prompt_inputs in enumerate(prepared):
+                if prompt_inputs is None or isinstance(prompt_inputs, Exception):
+                    reply_queue.put_nowait((pending_comments[i], prompt_inputs))
+                else:
+                    to_generate.append(i)
+
+            # Issue all LLM calls as a single batch, handing off each result as it lands
+            if to_generate:
+                async for j, raw in self.agent.chain.abatch_as_completed(
+                    [prepared[i] for i in to_generate],
+                    config={"max_concurrency": self.max_concurrency},
+                    return_exceptions=True
+                ):
+                    comment = pending_comments[to_generate[j]]
+                    response = raw if isinstance(raw, Exception) else (
+                        self.agent.postprocess(comment, raw)
+                    )
+                    reply_queue.put_nowait((comment, response))
+        finally:
+            # Stop the workers once the queue is drained, even if generation
+            # failed, so a reply being posted is never cut off before its
+            # outcome is recorded
+            for _ in workers:
+                reply_queue.put_nowait(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # Persist the remaining outcomes in one write
+            await self.comment_repo.apply_status_updates(
+                self.business_asset_id,
+                self._status_updates
+            )
+            self._status_updates = []
+
+        self._post_cache.clear()
+
+    async def _reply_worker(
+        self,
+        reply_queue: asyncio.Queue,
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Post replies and record outcomes for generated responses.
+
+        Pulls (comment, response) pairs off the queue until it gets None.
+
+        Args:
+            reply_queue: Queue of (comment, response) pairs, where response is
+                the generated text, None, or the exception raised generating it
+            results: Results dictionary to update
+        """
+        while True:
+            item = await reply_queue.get()
+            if item is None:
+                return
+            comment, response_text = item
             try:
-                await self._process_comment(comment, results)
+                await self._process_comment(comment, response_text, results)
                 results["processed"] += 1
             except Exception as e:
                 logger.error(
@@ -135,28 +236,66 @@ class CommentResponderRunner:
                     "error": str(e)
                 })
 
-        results["success"] = results["processed"] > 0
+    async def _prefetch_posts(self, pending_comments: List[Any]) -> None:
+        """
+        Fetch post context and all comments once per unique post.
 
-        logger.info(
-            "Comment responder run completed",
-            **{k: v for k, v in results.items() if k not in ["errors", "instagram_fetch"]}
-        )
+        Pending comments often share a post, so results are stored in
+        self._post_cache and reused by every comment on that post instead of
+        being fetched per comment. Fetch exceptions are cached as well so
+        each comment falls back exactly as it would on its own fetch.
 
-        return results
+        Args:
+            pending_comments: Comments being processed in this run
+        """
+        # Spam comments are filtered before any context is fetched
+        post_keys = list({
+            (comment.platform, comment.post_id)
+            for comment in pending_comments
+            if not is_spam(comment.comment_text)
+        })
+
+        async def _fetch(platform: str, post_id: str):
+            async with self.semaphore:
+                return tuple(await asyncio.gather(
+                    self.comment_ops.get_post_context(platform=platform, post_id=post_id),
+                    self.comment_ops.get_all_comments(
+                        platform=platform,
+                        post_id=post_id,
+                        limit=OTHER_COMMENTS_SAMPLE_SIZE
+                    ),
+                    return_exceptions=True
+                ))
+
+        fetched = await asyncio.gather(*[_fetch(*key) for key in post_keys])
+        self._post_cache = dict(zip(post_keys, fetched))
+
+    async def _prepare_comment(self, comment):
+        """Gather context and build the prompt for a comment, bounded by the semaphore."""
+        async with self.semaphore:
+            return await self.agent.prepare(comment, self._post_cache)
 
     async def _process_comment(
         self,
         comment,
+        response_text: Union[str, None, Exception],
         results: Dict[str, Any]
     ) -> None:
         """
-        Process a single comment.
+        Process a single comment once its response has been generated.
+
+        A posted reply is marked as responded right away, since the reply is
+        already public and a crash later in the run must not leave the comment
+        pending to be answered again. Ignored and failed outcomes are recorded
+        in self._status_updates and written at the end of the run.
 
         Args:
             comment: PlatformComment instance
+            response_text: Generated response, None if the comment should be
+                ignored, or the exception raised while generating it
             results: Results dictionary to update
         """
-        logger.info(
+        logger.debug(
             "Processing comment",
             business_asset_id=self.business_asset_id,
             comment_id=str(comment.id),
@@ -164,93 +303,134 @@ class CommentResponderRunner:
             commenter=comment.commenter_username
         )
 
-        try:
-            # Generate response
-            response_text = await self.agent.generate_response(comment)
-
-            # If no response (e.g., spam filtered), mark as ignored
-            if not response_text:
-                await self.comment_repo.mark_as_ignored(
-                    self.business_asset_id,
-                    comment.id
-                )
-                results["ignored"] += 1
-                logger.info(
-                    "Comment ignored",
-                    business_asset_id=self.business_asset_id,
-                    comment_id=str(comment.id)
-                )
-                return
-
-            # Post the response
-            try:
-                response_comment_id = await self.comment_ops.reply_to_comment(
-                    platform=comment.platform,
-                    comment_id=comment.comment_id,
-                    message=response_text
-                )
-
-                # Mark as responded
-                await self.comment_repo.mark_as_responded(
-                    business_asset_id=self.business_asset_id,
-                    comment_record_id=comment.id,
-                    response_text=response_text,
-                    response_comment_id=response_comment_id
-                )
-
-                results["responded"] += 1
-
-                logger.info(
-                    "Successfully responded to comment",
-                    business_asset_id=self.business_asset_id,
-                    comment_id=str(comment.id),
-                    response_id=response_comment_id
-                )
-
-            except Exception as e:
-                # Failed to post response
-                error_msg = f"Failed to post response: {str(e)}"
-                await self.comment_repo.mark_as_failed(
-                    business_asset_id=self.business_asset_id,
-                    comment_record_id=comment.id,
-                    error_message=error_msg,
-                    increment_retry=True
-                )
+        if isinstance(response_text, Exception):
+            # Failed to generate response
+            error_msg = f"Failed to generate response: {str(response_text)}"
+            self._status_updates.append({
+                "id": comment.id,
+                "status": "failed",
+                "error_message": error_msg,
+                "retry_increment": 1
+            })
 
-                results["failed"] += 1
+            results["failed"] += 1
 
-                logger.error(
-                    "Failed to post comment response",
-                    business_asset_id=self.business_asset_id,
-                    comment_id=str(comment.id),
-                    error=str(e)
-                )
+            logger.error(
+                "Failed to generate comment response",
+                business_asset_id=self.business_asset_id,
+                comment_id=str(comment.id),
+                error=str(response_text)
+            )
+            return
 
-        except Exception as e:
-            # Failed to generate response
-            error_msg = f"Failed to generate response: {str(e)}"
-            await self.comment_repo.mark_as_failed(
+        # If no response (e.g., spam filtered), mark as ignored
+        if not response_text:
+            self._status_updates.append({"id": comment.id, "status": "ignored"})
+            results["ignored"] += 1
+            logger.info(
+                "Comment ignored",
                 business_asset_id=self.business_asset_id,
-                comment_record_id=comment.id,
-                error_message=error_msg,
-                increment_retry=True
+                comment_id=str(comment.id)
             )
+            return
+
+        # Post the response
+        try:
+            response_comment_id = await self.comment_ops.reply_to_comment(
+                platform=comment.platform,
+                comment_id=comment.comment_id,
+                message=response_text
+            )
+        except Exception as e:
+            # Failed to post response
+            error_msg = f"Failed to post response: {str(e)}"
+            self._status_updates.append({
+                "id": comment.id,
+                "status": "failed",
+                "error_message": error_msg,
+                "retry_increment": 1
+            })
 
             results["failed"] += 1
 
             logger.error(
-                "Failed to generate comment response",
+                "Failed to post comment response",
                 business_asset_id=self.business_asset_id,
                 comment_id=str(comment.id),
                 error=str(e)
             )
+            return
+
+        # Mark as responded
+        marked = await self.comment_repo.mark_as_responded(
+            business_asset_id=self.business_asset_id,
+            comment_record_id=comment.id,
+            response_text=response_text,
+            response_comment_id=response_comment_id
+        )
+        if not marked:
+            # Retried with the end-of-run batch
+            self._status_updates.append({
+                "id": comment.id,
+                "status": "responded",
+                "response_text": response_text,
+                "response_comment_id": response_comment_id,
+                "responded_at": datetime.now(timezone.utc).isoformat()
+            })
+
+        results["responded"] += 1
+
+        logger.info(
+            "Successfully responded to comment",
+            business_asset_id=self.business_asset_id,
+            comment_id=str(comment.id),
+            response_id=response_comment_id
+        )
+
+
+async def fetch_instagram_comments(business_asset_id: str) -> Dict[str, Any]:
+    """
+    Fetch new Instagram comments for a business asset into the database.
+
+    Args:
+        business_asset_id: Business asset ID for multi-tenancy
+
+    Returns:
+        Summary dictionary for the "instagram_fetch" entry of run results
+    """
+    try:
+        instagram_results = await check_instagram_comments(
+            business_asset_id=business_asset_id
+        )
+        summary = {
+            "success": instagram_results.get("success", False),
+            "new_comments": instagram_results.get("new_comments_added", 0),
+            "media_checked": instagram_results.get("media_checked", 0)
+        }
+        logger.info(
+            "Instagram comment fetch completed",
+            business_asset_id=business_asset_id,
+            new_comments=summary["new_comments"]
+        )
+        return summary
+    except Exception as e:
+        logger.error(
+            "Failed to fetch Instagram comments",
+            business_asset_id=business_asset_id,
+            error=str(e)
+        )
+        return {
+            "success": False,
+            "error": str(e)
+        }
 
 
 async def run_comment_responder(
     business_asset_id: str,
     platform: str = None,
     limit: int = 10,
-    fetch_instagram_first: bool = True
+    fetch_instagram_first: bool = True,
+    pending_comments: Optional[List[PlatformComment]] = None
 ) -> Dict[str, Any]:
     """
     CLI entry point for running the comment responder for a single business asset.
@@ -260,6 +440,7 @@ async def run_comment_responder(
         platform: Optional platform filter ("facebook" or "instagram")
         limit: Maximum number of comments to process
         fetch_instagram_first: Whether to fetch new Instagram comments before processing
+        pending_comments: Optional pre-fetched pending comments for this asset
 
     Returns:
         Dictionary with results
@@ -268,26 +449,28 @@ async def run_comment_responder(
     return await runner.run(
         platform=platform,
         limit=limit,
-        fetch_instagram_first=fetch_instagram_first
+        fetch_instagram_first=fetch_instagram_first,
+        pending_comments=pending_comments
     )
 
 
 async def run_comment_responder_all_assets(
     platform: str = None,
     limit_per_asset: int = 10,
-    fetch_instagram_first: bool = True
+    fetch_instagram_first: bool = True,
+    max_parallel_assets: int = 10
 ) -> Dict[str, Any]:
     """
     Run the comment responder for all active business assets.
 
     This is the main entry point for scheduled/periodic comment response processing.
-    It iterates through all active business assets and processes pending comments
-    for each.
+    It processes pending comments for all active business assets concurrently.
 
     Args:
         platform: Optional platform filter ("facebook" or "instagram")
         limit_per_asset: Maximum number of comments to process per asset
         fetch_instagram_first: Whether to fetch new Instagram comments before processing
+        max_parallel_assets: Maximum number of business assets processed at once
 
     Returns:
         Dictionary with aggregated results from all assets
@@ -324,47 +507,81 @@ async def run_comment_responder_all_assets(
         "results": []
     }
 
-    # Process each business asset
-    for asset in active_assets:
-        try:
-            logger.info(
-                f"Processing business asset: {asset.name} ({asset.id})"
-            )
+    semaphore = asyncio.Semaphore(max_parallel_assets)
+    asset_ids = [asset.id for asset in active_assets]
 
-            result = await run_comment_responder(
-                business_asset_id=asset.id,
-                platform=platform,
-                limit=limit_per_asset,
-                fetch_instagram_first=fetch_instagram_first
-            )
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
 
-            aggregated_results["assets_processed"] += 1
-            aggregated_results["total_responded"] += result.get("responded", 0)
-            aggregated_results["total_failed"] += result.get("failed", 0)
-            aggregated_results["total_ignored"] += result.get("ignored", 0)
+    # Ingest new Instagram comments for every asset before loading pending ones
+    instagram_fetches: Dict[str, Any] = {}
+    if fetch_instagram_first and platform != "facebook":
+        fetched = await asyncio.gather(
+            *[_bounded(fetch_instagram_comments(asset_id)) for asset_id in asset_ids]
+        )
+        instagram_fetches = dict(zip(asset_ids, fetched))
 
-            # Track Instagram fetches
-            ig_fetch = result.get("instagram_fetch", {})
-            if ig_fetch and ig_fetch.get("success"):
-                aggregated_results["total_instagram_comments_fetched"] += ig_fetch.get("new_comments", 0)
+    # Load pending comments for all assets in one query; fall back to
+    # per-asset queries if it fails
+    pending_by_asset = await PlatformCommentRepository().get_pending_comments_multi(
+        business_asset_ids=asset_ids,
+        platform=platform,
+        limit_per_asset=limit_per_asset
+    )
 
-            aggregated_results["results"].append({
-                "business_asset_id": asset.id,
-                "business_asset_name": asset.name,
-                **result
-            })
+    async def _run_one(asset) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                logger.info(
+                    f"Processing business asset: {asset.name} ({asset.id})"
+                )
 
-        except Exception as e:
-            logger.error(
-                f"Failed to process business asset: {asset.id}",
-                error=str(e)
-            )
-            aggregated_results["results"].append({
-                "business_asset_id": asset.id,
-                "business_asset_name": asset.name,
-                "success": False,
-                "error": str(e)
-            })
+                result = await run_comment_responder(
+                    business_asset_id=asset.id,
+                    platform=platform,
+                    limit=limit_per_asset,
+                    fetch_instagram_first=False,
+                    pending_comments=(
+                        pending_by_asset.get(asset.id, [])
+                        if pending_by_asset is not None else None
+                    )
+                )
+                if asset.id in instagram_fetches:
+                    result["instagram_fetch"] = instagram_fetches[asset.id]
+
+                aggregated_results["assets_processed"] += 1
+                aggregated_results["total_responded"] += result.get("responded", 0)
+                aggregated_results["total_failed"] += result.get("failed", 0)
+                aggregated_results["total_ignored"] += result.get("ignored", 0)
+
+                # Track Instagram fetches
+                ig_fetch = result.get("instagram_fetch", {})
+                if ig_fetch and ig_fetch.get("success"):
+                    aggregated_results["total_instagram_comments_fetched"] += ig_fetch.get("new_comments", 0)
+
+                return {
+                    "business_asset_id": asset.id,
+                    "business_asset_name": asset.name,
+                    **result
+                }
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to process business asset: {asset.id}",
+                    error=str(e)
+                )
+                return {
+                    "business_asset_id": asset.id,
+                    "business_asset_name": asset.name,
+                    "success": False,
+                    "error": str(e)
+                }
+
+    # Process business assets concurrently; results keep the asset order
+    aggregated_results["results"] = await asyncio.gather(
+        *[_run_one(asset) for asset in active_assets]
+    )
 
     logger.info(
         "Comment responder completed for all assets",
@@ -8,7 +8,8 @@ or separate media based on the share_media_across_platforms config setting.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Literal, Optional
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Any, List, Literal, Optional, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone, timedelta
 from pydantic import BaseModel, Field
@@ -19,6 +20,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 from backend.config.settings import settings
 from backend.config.prompts import get_global_system_prompt
+from backend.scheduler import SCHEDULING_CONFIG
 from backend.database.repositories.content_creation_tasks import ContentCreationTaskRepository
 from backend.database.repositories.completed_posts import CompletedPostRepository
 from backend.database.repositories.news_event_seeds import NewsEventSeedRepository
@@ -31,8 +33,10 @@ from backend.services.wavespeed.image_generator import ImageGenerator
 from backend.services.wavespeed.video_generator import VideoGenerator
 from backend.services.wavespeed.model_configs import ImageSize
 from backend.services.supabase.storage import StorageService
-from backend.utils import get_logger
+from backend.utils import get_logger, TaskFailedError
 import asyncio
+import tempfile
+import weakref
 
 logger = get_logger(__name__)
 
@@ -42,6 +46,106 @@ AI_DISCLOSURE_FOOTNOTE = "\n\n✨ AI-assisted"
 # Source link format - appended to news event posts deterministically
 NEWS_SOURCE_LINK_FORMAT = "\n\n🔗 Read more: {url}"
 
+# Wavespeed video resolution per orientation
+VIDEO_SIZES = MappingProxyType({"landscape": "1280*720", "portrait": "720*1280"})
+
+# A Facebook post is scheduled this long after its Instagram counterpart
+FACEBOOK_SCHEDULE_OFFSET_MINUTES = 30
+
+# Task-independent part of the task message. Kept ahead of the seed and
+# allocations so it forms a prefix that is identical for every task.
+TASK_INSTRUCTIONS = """** Instructions **
+IMPORTANT: Use unified format output (format_type: "image", "video", "carousel", or "text_only")
+Each image/video/carousel post you create will automatically be posted to BOTH Instagram and Facebook!
+
+Create unified post outputs for the requested content. Each output creates posts on both platforms!
+
+For each post, specify:
+1. format_type: "image", "video", "carousel", or "text_only"
+2. text: The caption (will be used for both platforms)
+3. media_specs: List of media generation specifications (prompts for images/videos to generate)
+4. hashtags: List of relevant hashtags
+5. location: Optional location tag
+
+** MEDIA SPECS FORMAT **
+Instead of generating media directly, you specify WHAT media should be generated:
+
+For IMAGE posts, provide 1 media_spec:
+  {"media_type": "image", "prompt": "A detailed description of the image to generate...", "size": "SQUARE"}
+
+For VIDEO posts, provide 1 media_spec:
+  {"media_type": "video", "prompt": "A detailed description of the video to generate...", "orientation": "portrait"}
+
+For CAROUSEL posts, provide 2-10 image media_specs:
+  [
+    {"media_type": "image", "prompt": "First slide: ...", "size": "SQUARE"},
+    {"media_type": "image", "prompt": "Second slide: ...", "size": "SQUARE"},
+    ...
+  ]
+
+** IMAGE SIZE OPTIONS (use exact string values) **
+- "SQUARE" - 4096x4096, best for general posts (default)
+- "PORTRAIT_4_5" - 3277x4096, ideal for Instagram feed
+- "PORTRAIT_9_16" - 2304x4096, for Stories/Reels
+- "LANDSCAPE_16_9" - 4096x2304, for Facebook/YouTube widescreen
+
+The system will generate the media from your specs automatically.
+
+For CAROUSEL posts:
+- Provide 2-10 image specs with a cohesive theme
+- Great for listicles, step-by-step guides, multiple angles of same topic
+- All image prompts should tell a story or follow a theme
+"""
+
+# Dynamic parts of the task message, filled per task after TASK_INSTRUCTIONS
+TASK_HEADER_TEMPLATE = """
+Create social media content for the following task:
+
+** Content Seed **
+Type: {seed_type}
+"""
+
+NEWS_EVENT_SEED_TEMPLATE = """Name: {name}
+Location: {location}
+Time: {start_time} to {end_time}
+Description: {description}
+
+Sources:
+{sources}"""
+
+TREND_SEED_TEMPLATE = """Name: {name}
+Description: {description}
+Hashtags: {hashtags}
+{example_posts}"""
+
+UNGROUNDED_SEED_TEMPLATE = """Idea: {idea}
+Format: {format}
+Details: {details}
+"""
+
+TASK_ALLOCATIONS_TEMPLATE = """
+
+** Required Posts (Unified Format) **
+
+- Image Posts: {image_posts} (each creates IG image + FB feed, 1 image)
+- Video Posts: {video_posts} (each creates IG reel + FB video)
+- Carousel Posts: {carousel_posts} (each creates IG carousel + FB carousel, 2-10 images per carousel)
+- Text-Only Posts: {text_only_posts} (FB only)
+
+** Media Budgets **
+- Maximum Images: {image_budget} (this includes images for carousels!)
+- Maximum Videos: {video_budget}
+
+Remember:
+- Generate {image_posts} image posts (each creates 2 platform posts, 1 image each)
+- Generate {video_posts} video posts (each creates 2 platform posts)
+- Generate {carousel_posts} carousel posts (each creates 2 platform posts, 2-10 images each)
+- Generate {text_only_posts} text-only posts (FB only)
+"""
+
+# Agent-specific instructions, read once per process
+AGENT_PROMPT = (Path(__file__).parent / "prompts" / "content_creation.txt").read_text()
+
 
 class MediaGenerationSpec(BaseModel):
     """
@@ -109,6 +213,182 @@ class AgentResponse(BaseModel):
     posts: List[UnifiedPostOutput] = Field(..., description="List of unified post outputs")
 
 
+# Structured output strategy; AgentResponse is static, so build it once
+AGENT_RESPONSE_FORMAT = ToolStrategy(AgentResponse)
+
+# The agent has no tools, so each graph step is one model call: the first
+# attempt plus retries for invalid structured output. Cap it well below
+# LangGraph's default of 25 so a stuck run fails fast instead of re-sending
+# the full prompt over and over.
+AGENT_RECURSION_LIMIT = 4
+
+# Per-process cache of agent executors keyed by business asset ID
+_EXECUTOR_CACHE: Dict[str, Any] = {}
+
+# Media generation services, created on first use
+_MEDIA_SERVICES: Optional[Tuple[ImageGenerator, VideoGenerator, StorageService]] = None
+
+# Wavespeed concurrency caps (image, video) per event loop, created on first use
+_WAVESPEED_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.Semaphore, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_agent_executor(business_asset_id: str):
+    """
+    Get the content creation agent executor for a business asset.
+
+    The executor only depends on the business asset's system prompt, so the
+    ChatOpenAI client and compiled agent are built once and reused afterwards.
+
+    Args:
+        business_asset_id: Business asset ID for multi-tenancy
+
+    Returns:
+        Cached agent executor
+    """
+    executor = _EXECUTOR_CACHE.get(business_asset_id)
+    if executor is not None:
+        return executor
+
+    global_prompt = get_global_system_prompt(business_asset_id)
+
+    # Initialize LLM. The system prompt is a large static prefix shared by
+    # every task for this business asset, so route requests with a stable
+    # cache key to maximize OpenAI prompt cache hits. Tasks arrive hours
+    # apart (daily planning, periodic retries), so keep the cached prefix for
+    # 24h instead of the default few minutes.
+    llm = ChatOpenAI(
+        model=settings.default_model_name,
+        api_key=settings.get_model_api_key(),
+        temperature=0.7,  # Moderate-high for creative content
+        model_kwargs={
+            "prompt_cache_key": f"content_creation:{business_asset_id}",
+            "prompt_cache_retention": "24h",
+        },
+    )
+
+    # No tools needed - agent outputs structured media specs, we call services deterministically
+    executor = create_agent(
+        model=llm,
+        tools=[],  # No tools - agent outputs specs, we call services
+        system_prompt=f"{global_prompt}\n\n{AGENT_PROMPT}",
+        response_format=AGENT_RESPONSE_FORMAT
+    )
+    _EXECUTOR_CACHE[business_asset_id] = executor
+    return executor
+
+
+def _format_news_event_seed(seed) -> str:
+    """Format the seed section for a NewsEventSeed."""
+    return NEWS_EVENT_SEED_TEMPLATE.format(
+        name=seed.name,
+        location=seed.location,
+        start_time=seed.start_time,
+        end_time=seed.end_time or 'ongoing',
+        description=seed.description,
+        sources="".join(
+            f"{i}. {source.url}\n   Key Findings: {source.key_findings}\n"
+            for i, source in enumerate(seed.sources, 1)
+        ),
+    )
+
+
+def _format_trend_seed(seed) -> str:
+    """Format the seed section for a TrendSeed."""
+    example_posts = ""
+    if seed.posts:
+        example_posts = "\nExample Posts:\n" + "".join(
+            f"- {post.link}\n" for post in seed.posts[:5]
+        )
+    return TREND_SEED_TEMPLATE.format(
+        name=seed.name,
+        description=seed.description,
+        hashtags=', '.join(seed.hashtags) if seed.hashtags else 'None',
+        example_posts=example_posts,
+    )
+
+
+def _format_ungrounded_seed(seed) -> str:
+    """Format the seed section for an UngroundedSeed."""
+    return UNGROUNDED_SEED_TEMPLATE.format(
+        idea=seed.idea,
+        format=seed.format,
+        details=seed.details,
+    )
+
+
+# Seed section formatters keyed by content_seed_type
+_SEED_FORMATTERS = {
+    "news_event": _format_news_event_seed,
+    "trend": _format_trend_seed,
+    "ungrounded": _format_ungrounded_seed,
+}
+
+
+def _format_seed_details(seed_type: str, seed) -> str:
+    """Format the seed-specific section of the task context."""
+    format_seed = _SEED_FORMATTERS.get(seed_type)
+    return format_seed(seed) if format_seed else ""
+
+
+def _parse_scheduled_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a planned ISO-8601 scheduled time, returning None if it is missing or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _platform_schedule(platform: str) -> Dict[str, float]:
+    """Hours between consecutive posts and before the first post on a platform."""
+    if platform == "facebook":
+        return {
+            "interval_hours": SCHEDULING_CONFIG.FACEBOOK_POST_INTERVAL_HOURS,
+            "initial_delay_hours": SCHEDULING_CONFIG.FACEBOOK_INITIAL_DELAY_HOURS
+        }
+    return {
+        "interval_hours": SCHEDULING_CONFIG.INSTAGRAM_POST_INTERVAL_HOURS,
+        "initial_delay_hours": SCHEDULING_CONFIG.INSTAGRAM_INITIAL_DELAY_HOURS
+    }
+
+
+def _facebook_scheduled_time(instagram_time: Optional[datetime]) -> Optional[datetime]:
+    """Scheduled time of a Facebook post that accompanies an Instagram post."""
+    if instagram_time is None:
+        return None
+    return instagram_time + timedelta(minutes=FACEBOOK_SCHEDULE_OFFSET_MINUTES)
+
+
+def _get_media_services() -> Tuple[ImageGenerator, VideoGenerator, StorageService]:
+    """Get the shared image generator, video generator and storage service."""
+    global _MEDIA_SERVICES
+    if _MEDIA_SERVICES is None:
+        _MEDIA_SERVICES = (ImageGenerator(), VideoGenerator(), StorageService())
+    return _MEDIA_SERVICES
+
+
+def _get_wavespeed_semaphores() -> Tuple[asyncio.Semaphore, asyncio.Semaphore]:
+    """
+    Get the image and video generation semaphores for the running event loop.
+
+    Semaphores bind to the loop they are first awaited on, so they are created
+    per loop rather than at import time. Within a loop they are shared by every
+    agent instance so concurrent tasks respect the same Wavespeed caps.
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _WAVESPEED_SEMAPHORES.get(loop)
+    if semaphores is None:
+        semaphores = (
+            asyncio.Semaphore(settings.wavespeed_max_concurrent_images),
+            asyncio.Semaphore(settings.wavespeed_max_concurrent_videos),
+        )
+        _WAVESPEED_SEMAPHORES[loop] = semaphores
+    return semaphores
+
+
 class ContentCreationAgent:
     """
     Agent for creating social media posts from content tasks.
@@ -135,46 +415,48 @@ class ContentCreationAgent:
         self.ungrounded_repo = UngroundedSeedRepository()
         self.media_repo = MediaRepository()
 
+        # Seed lookup by content_seed_type
+        self._seed_fetchers = {
+            "news_event": self.news_repo.get_by_id,
+            "trend": self.trend_repo.get_by_id,
+            "ungrounded": self.ungrounded_repo.get_by_id,
+        }
+
         # Determine media sharing mode
         self.share_media = share_media if share_media is not None else settings.share_media_across_platforms
 
-        # Load prompts
-        prompt_path = Path(__file__).parent / "prompts" / "content_creation.txt"
-        self.agent_prompt = prompt_path.read_text()
-        self.global_prompt = get_global_system_prompt(self.business_asset_id)
+        # LLM executor and media services are shared across instances so repeated
+        # runs skip client construction and graph compilation
+        self.agent_executor = _get_agent_executor(business_asset_id)
+        self.image_generator, self.video_generator, self.storage_service = _get_media_services()
 
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=settings.default_model_name,
-            api_key=settings.get_model_api_key(),
-            temperature=0.7,  # Moderate-high for creative content
-        )
+        # Guards post creation when tasks are processed concurrently
+        self._post_creation_lock = asyncio.Lock()
 
-        # No tools needed - agent outputs structured media specs, we call services deterministically
-        self.agent_executor = create_agent(
-            model=self.llm,
-            tools=[],  # No tools - agent outputs specs, we call services
-            system_prompt=f"{self.global_prompt}\n\n{self.agent_prompt}",
-            response_format=ToolStrategy(AgentResponse)
-        )
+        # Latest scheduled time handed out per platform while tasks are running
+        self._schedule_cursor: Dict[str, datetime] = {}
+
+        # Number of create_content_for_task calls currently running
+        self._active_tasks = 0
 
-        # Initialize media generation services
-        self.image_generator = ImageGenerator()
-        self.video_generator = VideoGenerator()
-        self.storage_service = StorageService()
+        # In-flight media generations per task, keyed by spec parameters
+        self._media_tasks: Dict[str, Dict[tuple, asyncio.Task]] = {}
 
         logger.info(
             "ContentCreationAgent initialized",
             share_media=self.share_media
         )
 
-    async def _generate_media_from_spec(self, spec: MediaGenerationSpec) -> UUID:
+    async def _generate_media_from_spec(self, spec: MediaGenerationSpec, timestamp: str) -> UUID:
         """
         Generate media from a MediaGenerationSpec and return the media ID.
 
         This is called deterministically after the agent outputs its specs.
+
+        Args:
+            spec: Media generation spec from the agent
+            timestamp: Filename timestamp shared by all media in the batch
         """
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         file_id = uuid4().hex[:8]
 
         if spec.media_type == "image":
@@ -188,140 +470,182 @@ class ContentCreationAgent:
                     image_size = ImageSize.SQUARE
             logger.info("Generating image from spec", prompt=spec.prompt[:50], size=image_size.value if image_size else "default")
 
-            image_bytes = await self.image_generator.generate(spec.prompt, image_size)
+            # Cap in-flight generations to stay under Wavespeed rate limits
+            image_semaphore, _ = _get_wavespeed_semaphores()
+            async with image_semaphore:
+                output_url = await self.image_generator.generate_url(spec.prompt, image_size)
 
-            # Upload to storage
+            # Stream to a temp file, then upload to storage and save to database
             filename = f"{timestamp}_{file_id}.png"
             storage_path = f"ai-generated/images/{filename}"
-            public_url = await self.storage_service.upload_media(
-                storage_path, image_bytes, "image/png"
-            )
-
-            # Save to database
-            image = Image(
-                business_asset_id=self.business_asset_id,
-                storage_path=storage_path,
-                public_url=public_url,
-                prompt=spec.prompt,
-                file_size=len(image_bytes),
-                mime_type="image/png"
-            )
-            saved = await self.media_repo.create_image(image)
+            with tempfile.TemporaryFile() as media_file:
+                file_size = await self.image_generator.download_to_file(output_url, media_file)
+                image = Image(
+                    business_asset_id=self.business_asset_id,
+                    storage_path=storage_path,
+                    public_url=await self.storage_service.get_public_url(storage_path),
+                    prompt=spec.prompt,
+                    file_size=file_size,
+                    mime_type="image/png"
+                )
+                saved = await self._upload_and_save_media(
+                    media_file, image, self.media_repo.create_image
+                )
             logger.info("Image generated", media_id=str(saved.id))
             return saved.id
 
         elif spec.media_type == "video":
             # Generate video
             orientation = spec.orientation or "portrait"
-            size_map = {"landscape": "1280*720", "portrait": "720*1280"}
-            size = size_map.get(orientation, "720*1280")
+            size = VIDEO_SIZES.get(orientation, "720*1280")
             logger.info("Generating video from spec", prompt=spec.prompt[:50], orientation=orientation, duration=spec.duration)
 
-            video_bytes = await self.video_generator.generate(spec.prompt, size, duration=spec.duration)
+            # Videos are the most expensive Wavespeed call, so they get a tighter cap
+            _, video_semaphore = _get_wavespeed_semaphores()
+            async with video_semaphore:
+                output_url = await self.video_generator.generate_url(spec.prompt, size, duration=spec.duration)
 
-            # Upload to storage
+            # Stream to a temp file, then upload to storage and save to database
             filename = f"{timestamp}_{file_id}.mp4"
             storage_path = f"ai-generated/videos/{filename}"
-            public_url = await self.storage_service.upload_media(
-                storage_path, video_bytes, "video/mp4"
-            )
-
-            # Save to database
-            video = Video(
-                business_asset_id=self.business_asset_id,
-                storage_path=storage_path,
-                public_url=public_url,
-                prompt=spec.prompt,
-                file_size=len(video_bytes),
-                mime_type="video/mp4"
-            )
-            saved = await self.media_repo.create_video(video)
+            with tempfile.TemporaryFile() as media_file:
+                file_size = await self.video_generator.download_to_file(output_url, media_file)
+                video = Video(
+                    business_asset_id=self.business_asset_id,
+                    storage_path=storage_path,
+                    public_url=await self.storage_service.get_public_url(storage_path),
+                    prompt=spec.prompt,
+                    file_size=file_size,
+                    mime_type="video/mp4"
+                )
+                saved = await self._upload_and_save_media(
+                    media_file, video, self.media_repo.create_video
+                )
             logger.info("Video generated", media_id=str(saved.id))
             return saved.id
 
         else:
             raise ValueError(f"Unknown media type: {spec.media_type}")
 
-    async def _generate_all_media_for_post(self, unified_post: UnifiedPostOutput) -> List[UUID]:
-        """
-        Generate all media for a unified post from its specs.
-
-        For efficiency, generates images in parallel (carousels), but videos sequentially.
-        Returns list of media IDs in the same order as the specs.
+    async def _upload_and_save_media(self, media_file: BinaryIO, media, create_record):
         """
-        if not unified_post.media_specs:
-            return []
+        Upload a media file, then insert its database row.
 
-        # Separate image and video specs (images can be parallelized)
-        image_specs = [(i, s) for i, s in enumerate(unified_post.media_specs) if s.media_type == "image"]
-        video_specs = [(i, s) for i, s in enumerate(unified_post.media_specs) if s.media_type == "video"]
+        The row is only written once the storage object exists, so readers
+        never see a public_url pointing at a missing file. If the insert
+        fails, the uploaded file is removed so no orphan is left behind.
 
-        # Pre-allocate result array
-        results: List[Optional[UUID]] = [None] * len(unified_post.media_specs)
+        Args:
+            media_file: Open binary file holding the generated media
+            media: Image or Video model with storage_path/public_url set
+            create_record: Repository method that inserts the model
 
-        # Generate images in parallel
-        if image_specs:
-            image_tasks = [self._generate_media_from_spec(spec) for _, spec in image_specs]
-            image_results = await asyncio.gather(*image_tasks, return_exceptions=True)
+        Returns:
+            The saved Image or Video
+        """
+        # storage3 only streams BufferedReader/FileIO/bytes (anything else is
+        # treated as a path), so hand it a read-only view of the temp file
+        media_file.seek(0)
+        with open(media_file.fileno(), "rb", closefd=False) as upload_file:
+            await self.storage_service.upload_media(media.storage_path, upload_file, media.mime_type)
 
-            for (idx, _), result in zip(image_specs, image_results):
-                if isinstance(result, Exception):
-                    logger.error("Failed to generate image", error=str(result))
-                    raise result
-                results[idx] = result
+        try:
+            return await create_record(media)
+        except Exception:
+            await self.storage_service.delete_media(media.storage_path)
+            raise
 
-        # Generate videos sequentially (more resource intensive)
-        for idx, spec in video_specs:
-            result = await self._generate_media_from_spec(spec)
-            results[idx] = result
+    async def _generate_media_once(self, spec: MediaGenerationSpec, timestamp: str, task_id: str) -> UUID:
+        """
+        Generate media for a spec, sharing the result with identical specs.
 
-        # Filter out any None values (shouldn't happen if no errors)
-        return [r for r in results if r is not None]
+        Specs with the same type, prompt and parameters within a task (e.g. a
+        repeated carousel slide, or the same prompt in two posts) resolve to a
+        single Wavespeed generation and media row.
+        """
+        task_media = self._media_tasks.setdefault(task_id, {})
+        key = (spec.media_type, spec.prompt, spec.size, spec.orientation, spec.duration)
+        media_task = task_media.get(key)
+        if media_task is None:
+            media_task = asyncio.create_task(self._generate_media_from_spec(spec, timestamp))
+            task_media[key] = media_task
+        else:
+            logger.info("Reusing media for duplicate spec", media_type=spec.media_type, prompt=spec.prompt[:50])
+        return await media_task
 
-    async def _calculate_scheduled_time(self, platform: Literal["facebook", "instagram"]) -> datetime:
+    async def _generate_all_media_for_post(self, unified_post: UnifiedPostOutput, task_id: str) -> List[UUID]:
         """
-        Calculate the next scheduled posting time for a platform.
+        Generate all media for a unified post from its specs.
 
-        Based on the scheduling config and existing pending posts.
+        Images and videos are generated concurrently (bounded by the shared
+        per-media-type semaphores). Returns list of media IDs in the same
+        order as the specs.
         """
-        from backend.scheduler import SCHEDULING_CONFIG
+        if not unified_post.media_specs:
+            return []
+
+        # One timestamp per batch; uuid-based file IDs keep filenames unique
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        media_tasks = [
+            self._generate_media_once(spec, timestamp, task_id)
+            for spec in unified_post.media_specs
+        ]
+        results = await asyncio.gather(*media_tasks, return_exceptions=True)
+
+        for spec, result in zip(unified_post.media_specs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate {spec.media_type}", error=str(result))
+                raise result
 
-        # Get all pending posts for this platform, ordered by scheduled_posting_time
-        all_pending = await self.posts_repo.get_all_pending_posts(self.business_asset_id, platform)
+        return list(results)
 
-        # Filter for posts with scheduled times
-        scheduled_posts = [p for p in all_pending if p.scheduled_posting_time is not None]
+    async def _calculate_scheduled_time(
+        self,
+        platform: Literal["facebook", "instagram"],
+        not_before: Optional[datetime] = None
+    ) -> datetime:
+        """
+        Calculate the next scheduled posting time for a platform.
 
-        # Get the interval for this platform
-        if platform == "facebook":
-            interval_hours = SCHEDULING_CONFIG.FACEBOOK_POST_INTERVAL_HOURS
-            initial_delay_hours = SCHEDULING_CONFIG.FACEBOOK_INITIAL_DELAY_HOURS
-        else:  # instagram
-            interval_hours = SCHEDULING_CONFIG.INSTAGRAM_POST_INTERVAL_HOURS
-            initial_delay_hours = SCHEDULING_CONFIG.INSTAGRAM_INITIAL_DELAY_HOURS
+        Based on the scheduling config and existing pending posts. Used when
+        the database can't assign slots on insert: the latest pending schedule
+        is queried once per platform within a task and a local cursor is
+        advanced by the platform interval.
+
+        Args:
+            platform: Platform to schedule on
+            not_before: Latest time already used on this platform by posts that
+                are built but not yet inserted; the slot follows it
+        """
+        schedule = _platform_schedule(platform)
+        interval_hours = schedule["interval_hours"]
+        initial_delay_hours = schedule["initial_delay_hours"]
 
         now = datetime.now(timezone.utc)
+        latest_scheduled = self._schedule_cursor.get(platform)
 
-        if not scheduled_posts:
-            # No scheduled posts yet, schedule first post with initial delay
-            return now + timedelta(hours=initial_delay_hours)
+        if latest_scheduled is None:
+            # Find the latest scheduled time among pending posts for this platform
+            latest_scheduled = await self.posts_repo.get_latest_scheduled_time(self.business_asset_id, platform)
 
-        # Find the latest scheduled time
-        latest_scheduled = max(
-            scheduled_posts,
-            key=lambda p: p.scheduled_posting_time
-        ).scheduled_posting_time
+        if not_before is not None and (latest_scheduled is None or not_before > latest_scheduled):
+            latest_scheduled = not_before
 
-        # Schedule this post at interval after the latest
-        next_time = latest_scheduled + timedelta(hours=interval_hours)
+        if latest_scheduled is None:
+            # No scheduled posts yet, schedule first post with initial delay
+            next_time = now + timedelta(hours=initial_delay_hours)
+        else:
+            # Schedule this post at interval after the latest
+            next_time = latest_scheduled + timedelta(hours=interval_hours)
 
-        # If the calculated time is in the past, use initial delay from now
-        if next_time < now:
-            return now + timedelta(hours=initial_delay_hours)
+            # If the calculated time is in the past, use initial delay from now
+            if next_time < now:
+                next_time = now + timedelta(hours=initial_delay_hours)
 
+        self._schedule_cursor[platform] = next_time
         return next_time
 
-    async def create_content_for_task(self, task_id: str) -> List[Dict[str, Any]]:
+    async def create_content_for_task(self, task_id: str, task=None) -> List[Dict[str, Any]]:
         """
         Create all content for a specific task using unified format.
 
@@ -330,18 +654,40 @@ class ContentCreationAgent:
 
         Args:
             task_id: Content creation task ID
+            task: Already-loaded ContentCreationTask for task_id. If None,
+                  the task is fetched from the database.
 
         Returns:
             List of created completed posts
         """
         logger.info("Starting content creation for task", task_id=task_id, share_media=self.share_media)
 
+        self._active_tasks += 1
         try:
-            # Get task
-            task = await self.tasks_repo.get_by_id(self.business_asset_id, task_id)
+            # Get task (skip the round trip if the caller already has it)
+            if task is None:
+                task = await self.tasks_repo.get_by_id(self.business_asset_id, task_id)
             if not task:
                 raise Exception(f"Task {task_id} not found")
 
+            # Skip the agent entirely when there is nothing (or nothing affordable) to create
+            if not task.is_legacy_format:
+                if task.total_post_units == 0:
+                    logger.info("Task has no posts to create, skipping agent", task_id=task_id)
+                    await self.tasks_repo.update(self.business_asset_id, task_id, {"status": "completed"})
+                    return []
+
+                media_posts = task.image_posts + task.video_posts + task.carousel_posts
+                if media_posts and task.image_budget == 0 and task.video_budget == 0:
+                    error_msg = "Task requires media posts but has no image or video budget"
+                    logger.error("Misconfigured task detected", task_id=task_id, error=error_msg)
+                    await self.tasks_repo.update(
+                        self.business_asset_id,
+                        task_id,
+                        {"status": "failed", "error_message": error_msg}
+                    )
+                    raise TaskFailedError(error_msg, task_id=task_id)
+
             # Get content seed
             seed = await self._get_content_seed(
                 str(task.content_seed_id),
@@ -357,18 +703,32 @@ class ContentCreationAgent:
                     task_id,
                     {"status": "failed", "error_message": error_msg}
                 )
-                raise Exception(error_msg)
+                raise TaskFailedError(error_msg, task_id=task_id)
 
             # Build task context with unified format
             context = self._format_task_context(task, seed)
 
             # Run agent
-            config = {"verbose": True}
+            config = {"recursion_limit": AGENT_RECURSION_LIMIT}
             result = await self.agent_executor.ainvoke(
                 {"messages": [("human", context)]},
                 config=config
             )
 
+            # Track how much of the prompt was served from the provider's prompt cache
+            input_tokens = cache_read_tokens = 0
+            for message in result.get("messages", []):
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    cache_read_tokens += usage.get("input_token_details", {}).get("cache_read", 0)
+            logger.info(
+                "Agent token usage",
+                task_id=task_id,
+                input_tokens=input_tokens,
+                cache_read_input_tokens=cache_read_tokens
+            )
+
             # The agent's structured response is here
             structured_output: AgentResponse = result.get("structured_response")
 
@@ -385,49 +745,77 @@ class ContentCreationAgent:
                     if hasattr(first_source, 'url'):
                         source_url = str(first_source.url)
 
-            # Process each unified post: generate media, then create platform posts
-            posts = []
-            scheduled_times = task.scheduled_times or []
-            post_index = 0
-
-            for unified_post in structured_output.posts:
-                try:
-                    # Step 1: Generate all media from specs (deterministically)
-                    logger.info(
-                        "Generating media for post",
-                        format_type=unified_post.format_type,
-                        num_specs=len(unified_post.media_specs)
-                    )
-                    media_ids = await self._generate_all_media_for_post(unified_post)
-                    logger.info("Media generated", num_media=len(media_ids))
-
-                    # Get scheduled time from task (if available) or calculate
-                    scheduled_time_str = scheduled_times[post_index] if post_index < len(scheduled_times) else None
-
-                    # Step 2: Create platform-specific posts based on format type
-                    if unified_post.format_type == "text_only":
-                        # Text-only creates only Facebook post
-                        fb_posts = await self._create_fb_only_post(
-                            task, unified_post, media_ids, source_url, scheduled_time_str
-                        )
-                        posts.extend(fb_posts)
-                    elif unified_post.format_type == "carousel":
-                        # Carousel creates both IG carousel + FB carousel posts
-                        carousel_posts = await self._create_carousel_posts(
-                            task, unified_post, media_ids, source_url, scheduled_time_str
-                        )
-                        posts.extend(carousel_posts)
-                    else:
-                        # Image/video creates both IG + FB posts
-                        dual_posts = await self._create_dual_platform_posts(
-                            task, unified_post, media_ids, source_url, scheduled_time_str
+            # Source link and AI disclosure are the same for every post in the task
+            text_suffix = AI_DISCLOSURE_FOOTNOTE
+            if source_url:
+                text_suffix = NEWS_SOURCE_LINK_FORMAT.format(url=source_url) + text_suffix
+
+            # Generate media for all unified posts concurrently
+            media_results = await asyncio.gather(*[
+                self._generate_media_for_unified_output(unified_post, str(task.id))
+                for unified_post in structured_output.posts
+            ])
+
+            # Build platform posts in the agent's output order so planned times
+            # and schedule slots follow it regardless of which media finished
+            # first. Planned times go to successfully built posts in order;
+            # posts beyond them (or with unparseable times) take the next free
+            # slot when inserted.
+            planned_times = [_parse_scheduled_time(value) for value in task.scheduled_times or []]
+            built_posts = []
+            slots = []
+            num_built = 0
+            for unified_post, media_ids in zip(structured_output.posts, media_results):
+                if media_ids is None:
+                    continue
+                scheduled_time = planned_times[num_built] if num_built < len(planned_times) else None
+                platform_posts = await self._build_posts_for_unified_output(
+                    task, unified_post, media_ids, text_suffix, scheduled_time
+                )
+                if not platform_posts:
+                    continue
+
+                if scheduled_time is None:
+                    # Text-only posts follow the Facebook schedule; the other
+                    # formats are led by their Instagram post
+                    slot_platform = "facebook" if unified_post.format_type == "text_only" else "instagram"
+                    slots.extend(
+                        (
+                            num_built,
+                            slot_platform,
+                            0 if post.platform == slot_platform else FACEBOOK_SCHEDULE_OFFSET_MINUTES
                         )
-                        posts.extend(dual_posts)
-
-                    post_index += 1
+                        for post in platform_posts
+                    )
+                else:
+                    slots.extend([None] * len(platform_posts))
+                built_posts.extend(platform_posts)
+                num_built += 1
 
-                except Exception as e:
-                    logger.error("Error creating posts from unified output", error=str(e))
+            # Insert every platform post for the task in a single request
+            posts = []
+            if built_posts:
+                created_posts = await self._insert_posts(built_posts, slots)
+                posts = [created.model_dump(mode="json") for created in created_posts]
+
+                # One summary line per task; per-post details at debug level.
+                # IDs in the dumped posts are already strings.
+                post_logger = logger.bind(task_id=task_id, shared_media=self.share_media)
+                post_logger.info(
+                    "Posts created",
+                    num_posts=len(posts),
+                    post_ids=[post["id"] for post in posts]
+                )
+                for post in posts:
+                    post_logger.debug(
+                        "Post created",
+                        post_id=post["id"],
+                        platform=post["platform"],
+                        post_type=post["post_type"],
+                        num_media=len(post["media_ids"]),
+                        verification_group_id=post["verification_group_id"],
+                        is_primary=post["is_verification_primary"]
+                    )
 
             # Update task status — mark failed if no posts were created (e.g. transient media generation errors)
             if posts:
@@ -447,22 +835,221 @@ class ContentCreationAgent:
 
             return posts
 
+        except TaskFailedError:
+            # Already marked failed with its reason
+            raise
+
         except Exception as e:
             logger.error("Error in content creation", task_id=task_id, error=str(e))
             # Mark task as failed
             await self.tasks_repo.update(self.business_asset_id, task_id, {"status": "failed"})
             raise
 
-    async def _create_dual_platform_posts(
+        finally:
+            # Media dedup is per task; the scheduling cursor is shared by concurrent
+            # tasks and only reset once none are running
+            self._media_tasks.pop(str(task.id) if task else task_id, None)
+            self._active_tasks -= 1
+            if not self._active_tasks:
+                self._schedule_cursor.clear()
+
+    async def create_content_for_tasks(
+        self,
+        task_ids: List[str],
+        tasks: Optional[List[Any]] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Create content for several tasks concurrently.
+
+        Agent runs, seed fetches and media generation for different tasks
+        overlap, bounded by max_concurrency (and by the shared Wavespeed
+        semaphores for media).
+
+        Args:
+            task_ids: Content creation task IDs
+            tasks: Already-loaded tasks matching task_ids, if available
+            max_concurrency: Maximum tasks in flight
+                             (default: settings.content_creation_max_concurrent_tasks)
+
+        Returns:
+            Per-task results in the same order as task_ids: the list of
+            created posts, or the exception raised for that task
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.content_creation_max_concurrent_tasks)
+        tasks = tasks if tasks is not None else [None] * len(task_ids)
+
+        async def run(task_id: str, task):
+            async with semaphore:
+                return await self.create_content_for_task(task_id, task=task)
+
+        return await asyncio.gather(
+            *[run(task_id, task) for task_id, task in zip(task_ids, tasks)],
+            return_exceptions=True
+        )
+
+    async def _generate_media_for_unified_output(
+        self,
+        unified_post: UnifiedPostOutput,
+        task_id: str
+    ) -> Optional[List[UUID]]:
+        """
+        Generate media for a single unified post.
+
+        Errors are logged and swallowed so one failing post doesn't cancel
+        the others generating alongside it.
+
+        Returns:
+            Media IDs in spec order, or None if generation failed
+        """
+        try:
+            # Fix up carousel spec counts before paying for any generation
+            if unified_post.format_type == "carousel":
+                self._normalize_carousel_specs(unified_post)
+
+            logger.info(
+                "Generating media for post",
+                format_type=unified_post.format_type,
+                num_specs=len(unified_post.media_specs)
+            )
+            media_ids = await self._generate_all_media_for_post(unified_post, task_id)
+            logger.info("Media generated", num_media=len(media_ids))
+            return media_ids
+
+        except Exception as e:
+            logger.error("Error generating media for unified output", error=str(e))
+            return None
+
+    async def _build_posts_for_unified_output(
+        self,
+        task,
+        unified_post: UnifiedPostOutput,
+        media_ids: List[UUID],
+        text_suffix: str,
+        scheduled_time: Optional[datetime]
+    ) -> List[CompletedPost]:
+        """
+        Build the platform posts for a unified post whose media is ready.
+
+        Posts are returned unsaved so the whole task can be inserted at once.
+
+        Args:
+            scheduled_time: Planned posting time, or None to leave the posts
+                unscheduled until they take the next free slot on insert
+
+        Returns:
+            List of built completed posts (empty on failure)
+        """
+        try:
+            if unified_post.format_type == "text_only":
+                # Text-only creates only Facebook post
+                return await self._build_fb_only_post(
+                    task, unified_post, media_ids, text_suffix, scheduled_time
+                )
+            elif unified_post.format_type == "carousel":
+                # Carousel creates both IG carousel + FB carousel posts
+                return await self._build_carousel_posts(
+                    task, unified_post, media_ids, text_suffix, scheduled_time
+                )
+            else:
+                # Image/video creates both IG + FB posts
+                return await self._build_dual_platform_posts(
+                    task, unified_post, media_ids, text_suffix, scheduled_time
+                )
+
+        except Exception as e:
+            logger.error("Error creating posts from unified output", error=str(e))
+            return []
+
+    async def _insert_posts(
+        self,
+        posts: List[CompletedPost],
+        slots: List[Optional[Tuple[int, str, int]]]
+    ) -> List[CompletedPost]:
+        """
+        Insert a task's posts, giving those without a planned time the next free slots.
+
+        The database assigns slots in the same transaction as the insert, so
+        concurrent workers never collide and a failed insert takes no slots.
+        If that call fails, slots are computed here from the pending posts and
+        the posts are inserted with a plain multi-row insert.
+
+        Args:
+            posts: Built posts, in the agent's output order
+            slots: Per post, None if it has a planned time, else (slot number,
+                platform whose schedule the slot follows, minutes after the slot)
+
+        Returns:
+            Created posts, in the same order as given
+        """
+        schedule = {platform: _platform_schedule(platform) for platform in ("instagram", "facebook")}
+        created_posts = await self.posts_repo.create_many_scheduled(posts, slots, schedule)
+        if created_posts is not None:
+            return created_posts
+
+        # Serialized so concurrent tasks don't race on the fallback schedule cursor
+        async with self._post_creation_lock:
+            # None of the task's posts are in the database yet, so slots must
+            # follow its planned posts and the slots taken before them
+            latest_scheduled: Dict[str, datetime] = {}
+
+            def record(post: CompletedPost) -> None:
+                latest = latest_scheduled.get(post.platform)
+                if latest is None or post.scheduled_posting_time > latest:
+                    latest_scheduled[post.platform] = post.scheduled_posting_time
+
+            for post, slot in zip(posts, slots):
+                if slot is None and post.scheduled_posting_time is not None:
+                    record(post)
+
+            slot_times: Dict[int, datetime] = {}
+            for post, slot in zip(posts, slots):
+                if slot is None:
+                    continue
+                slot_number, slot_platform, offset_minutes = slot
+                if slot_number not in slot_times:
+                    slot_times[slot_number] = await self._calculate_scheduled_time(
+                        slot_platform, not_before=latest_scheduled.get(slot_platform)
+                    )
+                post.scheduled_posting_time = slot_times[slot_number] + timedelta(minutes=offset_minutes)
+                record(post)
+
+        return await self.posts_repo.create_many(posts)
+
+    def _normalize_carousel_specs(self, unified_post: UnifiedPostOutput) -> None:
+        """
+        Bring a carousel's media specs within the 2-10 image range in place.
+
+        More than 10 specs are truncated; fewer than 2 downgrade the post to a
+        single image post.
+        """
+        num_specs = len(unified_post.media_specs)
+
+        if num_specs < 2:
+            logger.warning(
+                "Carousel requires at least 2 images, falling back to single image post",
+                num_specs=num_specs
+            )
+            unified_post.format_type = "image"
+            unified_post.media_specs = unified_post.media_specs[:1]
+
+        elif num_specs > 10:
+            logger.warning(
+                "Carousel supports max 10 images, truncating",
+                num_specs=num_specs
+            )
+            unified_post.media_specs = unified_post.media_specs[:10]
+
+    async def _build_dual_platform_posts(
         self,
         task,
         unified_post: UnifiedPostOutput,
         media_ids: List[UUID],
-        source_url: Optional[str],
-        scheduled_time_str: Optional[str]
-    ) -> List[Dict[str, Any]]:
+        text_suffix: str,
+        scheduled_time: Optional[datetime]
+    ) -> List[CompletedPost]:
         """
-        Create both Instagram and Facebook posts from a unified post output.
+        Build both Instagram and Facebook posts from a unified post output.
 
         If share_media is True:
           - Both posts use the same media IDs
@@ -474,9 +1061,6 @@ class ContentCreationAgent:
           - Each post is standalone (no verification group)
           - Both posts are primary (both verified separately)
         """
-        posts = []
-        media_uuids = media_ids
-
         # Determine post types based on format
         if unified_post.format_type == "image":
             ig_post_type = "instagram_image"
@@ -485,26 +1069,14 @@ class ContentCreationAgent:
             ig_post_type = "instagram_reel"
             fb_post_type = "facebook_video"
 
-        # Prepare text with source link and AI disclosure
-        post_text = unified_post.text
-        if source_url:
-            post_text += NEWS_SOURCE_LINK_FORMAT.format(url=source_url)
-        post_text += AI_DISCLOSURE_FOOTNOTE
-
-        # Calculate scheduled times if not provided
-        if scheduled_time_str:
-            try:
-                base_scheduled_time = datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
-            except ValueError:
-                base_scheduled_time = await self._calculate_scheduled_time("instagram")
-        else:
-            base_scheduled_time = await self._calculate_scheduled_time("instagram")
+        # Append source link and AI disclosure
+        post_text = unified_post.text + text_suffix
 
         # Generate verification group ID if sharing media
         # When sharing, IG is primary (verified), FB is secondary (inherits result)
         verification_group_id = uuid4() if self.share_media else None
 
-        # Create Instagram post (always primary)
+        # Build Instagram post (always primary)
         ig_post = CompletedPost(
             business_asset_id=self.business_asset_id,
             task_id=task.id,
@@ -514,31 +1086,20 @@ class ContentCreationAgent:
             platform="instagram",
             post_type=ig_post_type,
             text=post_text,
-            media_ids=media_uuids,
+            media_ids=media_ids,
             location=unified_post.location,
             hashtags=unified_post.hashtags,
-            scheduled_posting_time=base_scheduled_time,
+            scheduled_posting_time=scheduled_time,
             verification_group_id=verification_group_id,
             is_verification_primary=True  # IG is always primary
         )
-        created_ig = await self.posts_repo.create(ig_post)
-        posts.append(created_ig.model_dump(mode="json"))
-        logger.info(
-            "Instagram post created",
-            post_id=str(created_ig.id),
-            post_type=ig_post_type,
-            shared_media=self.share_media,
-            verification_group_id=str(verification_group_id) if verification_group_id else None,
-            is_primary=True
-        )
 
-        # Create Facebook post
+        # Build Facebook post
         # For FB, schedule slightly after IG (or use separate calculation)
-        fb_scheduled_time = base_scheduled_time + timedelta(minutes=30)
+        fb_scheduled_time = _facebook_scheduled_time(scheduled_time)
 
         # If not sharing media, we would need to generate new media here
-        # For now, we use the same media IDs (actual media re-generation would require agent re-run)
-        fb_media_uuids = media_uuids  # Same media if sharing
+        # For now, FB reuses the IG media IDs (actual media re-generation would require agent re-run)
 
         # FB is secondary when sharing media (inherits verification), primary when not sharing
         fb_is_primary = not self.share_media
@@ -552,79 +1113,37 @@ class ContentCreationAgent:
             platform="facebook",
             post_type=fb_post_type,
             text=post_text,
-            media_ids=fb_media_uuids,
+            media_ids=media_ids,
             location=unified_post.location,
             hashtags=unified_post.hashtags,
             scheduled_posting_time=fb_scheduled_time,
             verification_group_id=verification_group_id,
             is_verification_primary=fb_is_primary
         )
-        created_fb = await self.posts_repo.create(fb_post)
-        posts.append(created_fb.model_dump(mode="json"))
-        logger.info(
-            "Facebook post created",
-            post_id=str(created_fb.id),
-            post_type=fb_post_type,
-            shared_media=self.share_media,
-            verification_group_id=str(verification_group_id) if verification_group_id else None,
-            is_primary=fb_is_primary
-        )
+        return [ig_post, fb_post]
 
-        return posts
-
-    async def _create_carousel_posts(
+    async def _build_carousel_posts(
         self,
         task,
         unified_post: UnifiedPostOutput,
         media_ids: List[UUID],
-        source_url: Optional[str],
-        scheduled_time_str: Optional[str]
-    ) -> List[Dict[str, Any]]:
+        text_suffix: str,
+        scheduled_time: Optional[datetime]
+    ) -> List[CompletedPost]:
         """
-        Create both Instagram and Facebook carousel posts from a unified post output.
+        Build both Instagram and Facebook carousel posts from a unified post output.
 
-        Carousels require 2-10 images. Both platforms use the same media IDs.
+        Carousels require 2-10 images; spec counts are normalized before media
+        generation. Both platforms use the same media IDs.
         Similar to dual platform posts but uses instagram_carousel and facebook_feed post types.
         """
-        posts = []
-        media_uuids = media_ids
-
-        # Validate carousel has enough images
-        if len(media_uuids) < 2:
-            logger.warning(
-                "Carousel requires at least 2 images, got %d. Falling back to single image post.",
-                len(media_uuids)
-            )
-            # Fall back to single image post if not enough images
-            unified_post.format_type = "image"
-            return await self._create_dual_platform_posts(task, unified_post, media_ids, source_url, scheduled_time_str)
-
-        if len(media_uuids) > 10:
-            logger.warning(
-                "Carousel supports max 10 images, got %d. Truncating.",
-                len(media_uuids)
-            )
-            media_uuids = media_uuids[:10]
-
-        # Prepare text with source link and AI disclosure
-        post_text = unified_post.text
-        if source_url:
-            post_text += NEWS_SOURCE_LINK_FORMAT.format(url=source_url)
-        post_text += AI_DISCLOSURE_FOOTNOTE
-
-        # Calculate scheduled times if not provided
-        if scheduled_time_str:
-            try:
-                base_scheduled_time = datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
-            except ValueError:
-                base_scheduled_time = await self._calculate_scheduled_time("instagram")
-        else:
-            base_scheduled_time = await self._calculate_scheduled_time("instagram")
+        # Append source link and AI disclosure
+        post_text = unified_post.text + text_suffix
 
         # Generate verification group ID if sharing media
         verification_group_id = uuid4() if self.share_media else None
 
-        # Create Instagram carousel post
+        # Build Instagram carousel post
         ig_post = CompletedPost(
             business_asset_id=self.business_asset_id,
             task_id=task.id,
@@ -634,25 +1153,16 @@ class ContentCreationAgent:
             platform="instagram",
             post_type="instagram_carousel",
             text=post_text,
-            media_ids=media_uuids,
+            media_ids=media_ids,
             location=unified_post.location,
             hashtags=unified_post.hashtags,
-            scheduled_posting_time=base_scheduled_time,
+            scheduled_posting_time=scheduled_time,
             verification_group_id=verification_group_id,
             is_verification_primary=True
         )
-        created_ig = await self.posts_repo.create(ig_post)
-        posts.append(created_ig.model_dump(mode="json"))
-        logger.info(
-            "Instagram carousel post created",
-            post_id=str(created_ig.id),
-            num_images=len(media_uuids),
-            shared_media=self.share_media,
-            verification_group_id=str(verification_group_id) if verification_group_id else None
-        )
 
-        # Create Facebook carousel post
-        fb_scheduled_time = base_scheduled_time + timedelta(minutes=30)
+        # Build Facebook carousel post
+        fb_scheduled_time = _facebook_scheduled_time(scheduled_time)
         fb_is_primary = not self.share_media
 
         fb_post = CompletedPost(
@@ -664,53 +1174,29 @@ class ContentCreationAgent:
             platform="facebook",
             post_type="facebook_feed",  # Facebook carousels use feed post type
             text=post_text,
-            media_ids=media_uuids,
+            media_ids=media_ids,
             location=unified_post.location,
             hashtags=unified_post.hashtags,
             scheduled_posting_time=fb_scheduled_time,
             verification_group_id=verification_group_id,
             is_verification_primary=fb_is_primary
         )
-        created_fb = await self.posts_repo.create(fb_post)
-        posts.append(created_fb.model_dump(mode="json"))
-        logger.info(
-            "Facebook carousel post created",
-            post_id=str(created_fb.id),
-            num_images=len(media_uuids),
-            shared_media=self.share_media,
-            verification_group_id=str(verification_group_id) if verification_group_id else None
-        )
+        return [ig_post, fb_post]
 
-        return posts
-
-    async def _create_fb_only_post(
+    async def _build_fb_only_post(
         self,
         task,
         unified_post: UnifiedPostOutput,
         media_ids: List[UUID],
-        source_url: Optional[str],
-        scheduled_time_str: Optional[str]
-    ) -> List[Dict[str, Any]]:
+        text_suffix: str,
+        scheduled_time: Optional[datetime]
+    ) -> List[CompletedPost]:
         """
-        Create a Facebook-only text post (no Instagram equivalent).
+        Build a Facebook-only text post (no Instagram equivalent).
         Note: media_ids is accepted for API consistency but ignored for text_only posts.
         """
-        posts = []
-
-        # Prepare text with source link and AI disclosure
-        post_text = unified_post.text
-        if source_url:
-            post_text += NEWS_SOURCE_LINK_FORMAT.format(url=source_url)
-        post_text += AI_DISCLOSURE_FOOTNOTE
-
-        # Calculate scheduled time
-        if scheduled_time_str:
-            try:
-                scheduled_time = datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
-            except ValueError:
-                scheduled_time = await self._calculate_scheduled_time("facebook")
-        else:
-            scheduled_time = await self._calculate_scheduled_time("facebook")
+        # Append source link and AI disclosure
+        post_text = unified_post.text + text_suffix
 
         fb_post = CompletedPost(
             business_asset_id=self.business_asset_id,
@@ -726,14 +1212,7 @@ class ContentCreationAgent:
             hashtags=unified_post.hashtags,
             scheduled_posting_time=scheduled_time
         )
-        created_fb = await self.posts_repo.create(fb_post)
-        posts.append(created_fb.model_dump(mode="json"))
-        logger.info(
-            "Facebook text-only post created",
-            post_id=str(created_fb.id)
-        )
-
-        return posts
+        return [fb_post]
 
     async def _get_content_seed(
         self,
@@ -741,118 +1220,33 @@ class ContentCreationAgent:
         seed_type: str
     ):
         """Fetch content seed based on type."""
-        if seed_type == "news_event":
-            return await self.news_repo.get_by_id(self.business_asset_id, seed_id)
-        elif seed_type == "trend":
-            return await self.trend_repo.get_by_id(self.business_asset_id, seed_id)
-        elif seed_type == "ungrounded":
-            return await self.ungrounded_repo.get_by_id(self.business_asset_id, seed_id)
-        else:
+        fetch_seed = self._seed_fetchers.get(seed_type)
+        if fetch_seed is None:
             raise ValueError(f"Unknown seed type: {seed_type}")
+        return await fetch_seed(self.business_asset_id, seed_id)
 
     def _format_task_context(
         self,
         task,  # ContentCreationTask model
         seed  # Pydantic model (NewsEventSeed, TrendSeed, or UngroundedSeed)
     ) -> str:
-        """Format task and seed information for the agent using unified format."""
-        context = f"""Create social media content for the following task:
-
-** Content Seed **
-Type: {task.content_seed_type}
-"""
-
-        # Add seed-specific information
-        if task.content_seed_type == "news_event":
-            context += f"""Name: {seed.name if hasattr(seed, 'name') else 'Unnamed'}
-Location: {seed.location if hasattr(seed, 'location') else 'Unknown'}
-Time: {seed.start_time} to {seed.end_time if hasattr(seed, 'end_time') and seed.end_time else 'ongoing'}
-Description: {seed.description if hasattr(seed, 'description') else ''}
-
-Sources:
-"""
-            if hasattr(seed, 'sources') and seed.sources:
-                for i, src in enumerate(seed.sources, 1):
-                    context += f"{i}. {src.url if hasattr(src, 'url') else 'No URL'}\n"
-                    context += f"   Key Findings: {src.key_findings if hasattr(src, 'key_findings') else 'N/A'}\n"
-
-        elif task.content_seed_type == "trend":
-            context += f"""Name: {seed.name if hasattr(seed, 'name') else 'Unnamed'}
-Description: {seed.description if hasattr(seed, 'description') else ''}
-Hashtags: {', '.join(seed.hashtags) if hasattr(seed, 'hashtags') and seed.hashtags else 'None'}
-"""
-            if hasattr(seed, 'posts') and seed.posts:
-                context += f"\nExample Posts:\n"
-                for post in seed.posts[:5]:
-                    context += f"- {post.link if hasattr(post, 'link') else 'No link'}\n"
-
-        elif task.content_seed_type == "ungrounded":
-            context += f"""Idea: {seed.idea if hasattr(seed, 'idea') else ''}
-Format: {seed.format if hasattr(seed, 'format') else 'Unknown'}
-Details: {seed.details if hasattr(seed, 'details') else ''}
-"""
-
-        # Add unified format allocations
-        carousel_posts = getattr(task, 'carousel_posts', 0) or 0
-        context += f"""\n
-** Required Posts (Unified Format) **
-
-IMPORTANT: Use unified format output (format_type: "image", "video", "carousel", or "text_only")
-Each image/video/carousel post you create will automatically be posted to BOTH Instagram and Facebook!
-
-- Image Posts: {task.image_posts} (each creates IG image + FB feed, 1 image)
-- Video Posts: {task.video_posts} (each creates IG reel + FB video)
-- Carousel Posts: {carousel_posts} (each creates IG carousel + FB carousel, 2-10 images per carousel)
-- Text-Only Posts: {task.text_only_posts} (FB only)
-
-** Media Budgets **
-- Maximum Images: {task.image_budget} (this includes images for carousels!)
-- Maximum Videos: {task.video_budget}
-
-** Instructions **
-Create unified post outputs for the requested content. Each output creates posts on both platforms!
-
-For each post, specify:
-1. format_type: "image", "video", "carousel", or "text_only"
-2. text: The caption (will be used for both platforms)
-3. media_specs: List of media generation specifications (prompts for images/videos to generate)
-4. hashtags: List of relevant hashtags
-5. location: Optional location tag
-
-** MEDIA SPECS FORMAT **
-Instead of generating media directly, you specify WHAT media should be generated:
-
-For IMAGE posts, provide 1 media_spec:
-  {{"media_type": "image", "prompt": "A detailed description of the image to generate...", "size": "SQUARE"}}
-
-For VIDEO posts, provide 1 media_spec:
-  {{"media_type": "video", "prompt": "A detailed description of the video to generate...", "orientation": "portrait"}}
-
-For CAROUSEL posts, provide 2-10 image media_specs:
-  [
-    {{"media_type": "image", "prompt": "First slide: ...", "size": "SQUARE"}},
-    {{"media_type": "image", "prompt": "Second slide: ...", "size": "SQUARE"}},
-    ...
-  ]
-
-** IMAGE SIZE OPTIONS (use exact string values) **
-- "SQUARE" - 4096x4096, best for general posts (default)
-- "PORTRAIT_4_5" - 3277x4096, ideal for Instagram feed
-- "PORTRAIT_9_16" - 2304x4096, for Stories/Reels
-- "LANDSCAPE_16_9" - 4096x2304, for Facebook/YouTube widescreen
-
-The system will generate the media from your specs automatically.
-
-Remember:
-- Generate {task.image_posts} image posts (each creates 2 platform posts, 1 image each)
-- Generate {task.video_posts} video posts (each creates 2 platform posts)
-- Generate {carousel_posts} carousel posts (each creates 2 platform posts, 2-10 images each)
-- Generate {task.text_only_posts} text-only posts (FB only)
-
-For CAROUSEL posts:
-- Provide 2-10 image specs with a cohesive theme
-- Great for listicles, step-by-step guides, multiple angles of same topic
-- All image prompts should tell a story or follow a theme
-"""
+        """
+        Format task and seed information for the agent using unified format.
 
-        return context
\ No newline at end of file
+        The static TASK_INSTRUCTIONS come first so every task shares a long
+        cacheable prefix; seed details and post allocations follow.
+        """
+        return "".join([
+            TASK_INSTRUCTIONS,
+            TASK_HEADER_TEMPLATE.format(seed_type=task.content_seed_type),
+            _format_seed_details(task.content_seed_type, seed),
+            # Each count is read once; the template repeats them where needed
+            TASK_ALLOCATIONS_TEMPLATE.format(
+                image_posts=task.image_posts,
+                video_posts=task.video_posts,
+                carousel_posts=task.carousel_posts or 0,
+                text_only_posts=task.text_only_posts,
+                image_budget=task.image_budget,
+                video_budget=task.video_budget,
+            ),
+        ])
\ No newline at end of file
@@ -161,46 +161,44 @@ class ContentCreationRunner:
 
             logger.info(f"Found {len(pending_tasks)} pending tasks and {len(failed_tasks)} failed tasks to retry")
 
+            # Tasks are independent, so run them concurrently (bounded by
+            # settings.content_creation_max_concurrent_tasks)
+            task_ids = [str(task.id) for task in all_tasks]
+            task_results = await self.agent.create_content_for_tasks(task_ids, tasks=all_tasks)
+
             results = []
             total_posts = 0
             all_post_ids = []
 
-            for task in all_tasks:
-                task_id = str(task.id)
-
-                try:
-                    logger.info(f"Processing task {task_id}")
-
-                    # Create content for task
-                    posts = await self.agent.create_content_for_task(task_id)
-
-                    post_ids = [str(p.id) if hasattr(p, 'id') else p["id"] for p in posts]
-                    all_post_ids.extend(post_ids)
-
-                    results.append({
-                        "task_id": task_id,
-                        "success": True,
-                        "posts_created": len(posts),
-                        "post_ids": post_ids
-                    })
-
-                    total_posts += len(posts)
-
-                    logger.info(
-                        f"Task {task_id} completed",
-                        posts_created=len(posts)
-                    )
-
-                except Exception as e:
+            for task_id, posts in zip(task_ids, task_results):
+                if isinstance(posts, Exception):
                     logger.error(
                         f"Error processing task {task_id}",
-                        error=str(e)
+                        error=str(posts)
                     )
                     results.append({
                         "task_id": task_id,
                         "success": False,
-                        "error": str(e)
+                        "error": str(posts)
                     })
+                    continue
+
+                post_ids = [str(p.id) if hasattr(p, 'id') else p["id"] for p in posts]
+                all_post_ids.extend(post_ids)
+
+                results.append({
+                    "task_id": task_id,
+                    "success": True,
+                    "posts_created": len(posts),
+                    "post_ids": post_ids
+                })
+
+                total_posts += len(posts)
+
+                logger.info(
+                    f"Task {task_id} completed",
+                    posts_created=len(posts)
+                )
 
             # Verify all created posts
             verification_results = await self._verify_posts(all_post_ids)
@@ -255,7 +253,7 @@ class ContentCreationRunner:
                 }
 
             # Create content
-            posts = await self.agent.create_content_for_task(task_id)
+            posts = await self.agent.create_content_for_task(task_id, task=task)
 
             post_ids = [str(p.id) if hasattr(p, 'id') else p["id"] for p in posts]
 
@@ -81,6 +81,11 @@ class Settings(BaseSettings):
     wavespeed_api_base: str = "https://api.wavespeed.ai/api/v3"
     wavespeed_polling_interval: float = 2.0
     wavespeed_max_poll_attempts: int = 1200
+    wavespeed_max_concurrent_images: int = 6  # In-flight image generations per process
+    wavespeed_max_concurrent_videos: int = 3  # In-flight video generations per process
+
+    # Content creation configuration
+    content_creation_max_concurrent_tasks: int = 3  # Tasks run at once by create_content_for_tasks
 
     # Planner context limits (how many recent seeds to fetch for planning)
     planner_news_seeds_limit: int = 10
@@ -0,0 +1,28 @@
+-- Migration 041: Add function to fetch pending comments for many business assets at once
+-- The comment responder runs for every active business asset. This lets it load all
+-- pending comments in a single round trip while still capping comments per asset.
+
+CREATE OR REPLACE FUNCTION get_pending_comments_multi(
+    p_business_asset_ids TEXT[],
+    p_platform TEXT DEFAULT NULL,
+    p_limit_per_asset INTEGER DEFAULT 10
+)
+RETURNS SETOF platform_comments AS $$
+    SELECT pc.*
+    FROM platform_comments pc
+    JOIN (
+        SELECT id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY business_asset_id
+                   ORDER BY created_time ASC
+               ) AS rn
+        FROM platform_comments
+        WHERE business_asset_id = ANY(p_business_asset_ids)
+          AND status = 'pending'
+          AND (p_platform IS NULL OR platform::TEXT = p_platform)
+    ) ranked ON ranked.id = pc.id
+    WHERE ranked.rn <= p_limit_per_asset
+    ORDER BY pc.business_asset_id, pc.created_time ASC;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_pending_comments_multi IS 'Oldest pending comments per business asset (up to p_limit_per_asset each), optionally filtered by platform';
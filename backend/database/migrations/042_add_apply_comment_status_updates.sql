@@ -0,0 +1,29 @@
+-- Migration 042: Add function to apply many comment status updates in one statement
+-- The comment responder collects the outcome of every comment in a run (responded,
+-- failed, ignored) and writes them together instead of one UPDATE per comment.
+
+CREATE OR REPLACE FUNCTION apply_comment_status_updates(p_updates JSONB)
+RETURNS SETOF platform_comments AS $$
+    UPDATE platform_comments AS pc
+    SET status = u.status::comment_status,
+        response_text = COALESCE(u.response_text, pc.response_text),
+        response_comment_id = COALESCE(u.response_comment_id, pc.response_comment_id),
+        responded_at = COALESCE(u.responded_at, pc.responded_at),
+        error_message = COALESCE(u.error_message, pc.error_message),
+        retry_count = pc.retry_count + COALESCE(u.retry_increment, 0)
+    FROM jsonb_to_recordset(p_updates) AS u(
+        id UUID,
+        business_asset_id TEXT,
+        status TEXT,
+        response_text TEXT,
+        response_comment_id TEXT,
+        responded_at TIMESTAMP WITH TIME ZONE,
+        error_message TEXT,
+        retry_increment INTEGER
+    )
+    WHERE pc.id = u.id
+      AND pc.business_asset_id = u.business_asset_id
+    RETURNING pc.*;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION apply_comment_status_updates IS 'Bulk-apply comment responder outcomes; each element of p_updates is {id, business_asset_id, status, ...optional fields, retry_increment}';
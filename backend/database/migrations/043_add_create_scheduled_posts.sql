@@ -0,0 +1,89 @@
+-- Migration 043: Add function to insert a task's posts and schedule them in one transaction
+-- Content creation used to scan pending posts to find the latest scheduled time before
+-- every post. create_scheduled_posts() inserts all posts of a task in one call and gives
+-- each post without a planned time the next free slot after the latest pending post on
+-- its platform. Slots are computed under a per business asset and platform advisory lock
+-- held until commit, so concurrent workers never receive overlapping times. Nothing but
+-- the posts themselves is stored, so a failed insert, or pending posts that are later
+-- rejected or deleted, never push the schedule further out.
+
+CREATE OR REPLACE FUNCTION create_scheduled_posts(p_posts JSONB, p_schedule JSONB)
+RETURNS SETOF completed_posts AS $$
+DECLARE
+    v_lock RECORD;
+    v_slot RECORD;
+    v_latest TIMESTAMP WITH TIME ZONE;
+    v_slot_time TIMESTAMP WITH TIME ZONE;
+BEGIN
+    -- Serialize scheduling per business asset and platform until commit. Locks are taken
+    -- in a fixed order so concurrent calls can't deadlock
+    FOR v_lock IN
+        SELECT DISTINCT post->>'business_asset_id' AS business_asset_id, post->>'platform' AS platform
+        FROM jsonb_array_elements(p_posts) AS post
+        ORDER BY 1, 2
+    LOOP
+        PERFORM pg_advisory_xact_lock(hashtext(v_lock.business_asset_id || ':' || v_lock.platform));
+    END LOOP;
+
+    -- Posts with a planned time go in first so the slots below follow them
+    RETURN QUERY
+    WITH inserted AS (
+        INSERT INTO completed_posts
+        SELECT r.*
+        FROM jsonb_array_elements(p_posts) AS post
+        CROSS JOIN LATERAL jsonb_populate_record(NULL::completed_posts, post) AS r
+        WHERE post->>'slot' IS NULL
+        RETURNING *
+    )
+    SELECT * FROM inserted;
+
+    -- Slots are filled in order. Every post of a slot shares its time, shifted by the
+    -- post's slot_offset_minutes (a Facebook post follows its Instagram counterpart)
+    FOR v_slot IN
+        SELECT DISTINCT
+            (post->>'slot')::INTEGER AS slot,
+            post->>'business_asset_id' AS business_asset_id,
+            post->>'slot_platform' AS platform
+        FROM jsonb_array_elements(p_posts) AS post
+        WHERE post->>'slot' IS NOT NULL
+        ORDER BY 1
+    LOOP
+        -- Served by idx_completed_posts_scheduled_pending; includes posts inserted above
+        SELECT MAX(scheduled_posting_time) INTO v_latest
+        FROM completed_posts
+        WHERE business_asset_id = v_slot.business_asset_id
+          AND platform = v_slot.platform::platform_type
+          AND status = 'pending'
+          AND scheduled_posting_time IS NOT NULL;
+
+        v_slot_time := v_latest + make_interval(
+            secs => (p_schedule->v_slot.platform->>'interval_hours')::DOUBLE PRECISION * 3600
+        );
+        -- No pending posts, or the next slot is already in the past: start from now
+        IF v_slot_time IS NULL OR v_slot_time < NOW() THEN
+            v_slot_time := NOW() + make_interval(
+                secs => (p_schedule->v_slot.platform->>'initial_delay_hours')::DOUBLE PRECISION * 3600
+            );
+        END IF;
+
+        RETURN QUERY
+        WITH inserted AS (
+            INSERT INTO completed_posts
+            SELECT r.*
+            FROM jsonb_array_elements(p_posts) AS post
+            CROSS JOIN LATERAL jsonb_populate_record(
+                NULL::completed_posts,
+                post || jsonb_build_object(
+                    'scheduled_posting_time',
+                    v_slot_time + make_interval(mins => COALESCE((post->>'slot_offset_minutes')::INTEGER, 0))
+                )
+            ) AS r
+            WHERE (post->>'slot')::INTEGER = v_slot.slot
+            RETURNING *
+        )
+        SELECT * FROM inserted;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_scheduled_posts IS 'Insert completed posts, assigning the next free slots to posts with a "slot" (and "slot_platform", optional "slot_offset_minutes"); p_schedule maps platform to {interval_hours, initial_delay_hours}';
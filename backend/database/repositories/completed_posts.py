@@ -2,9 +2,10 @@
 
 """Repository for completed posts."""
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 from uuid import UUID
 from backend.models import CompletedPost
+from backend.utils import DatabaseError
 from .base import BaseRepository
 from datetime import datetime, timezone
 
@@ -14,6 +15,104 @@ class CompletedPostRepository(BaseRepository[CompletedPost]):
     def __init__(self):
         super().__init__("completed_posts", CompletedPost)
 
+    async def create_many(self, posts: List[CompletedPost]) -> List[CompletedPost]:
+        """
+        Insert several posts in a single request.
+
+        Args:
+            posts: Posts to insert
+
+        Returns:
+            Created posts, in the same order as given
+
+        Raises:
+            DatabaseError: If insertion fails
+        """
+        try:
+            from backend.database import get_supabase_admin_client
+            client = await get_supabase_admin_client()
+            rows = [post.model_dump(mode="json", exclude_unset=True) for post in posts]
+            # Columns a row leaves unset fall back to their database defaults
+            result = await client.table(self.table_name).insert(rows, default_to_null=False).execute()
+
+            if len(result.data) != len(posts):
+                raise DatabaseError(
+                    f"Expected {len(posts)} created posts, got {len(result.data)}"
+                )
+
+            return [self.model_class(**item) for item in result.data]
+        except Exception as e:
+            from backend.utils import get_logger
+            logger = get_logger(__name__)
+            logger.error(
+                "Failed to create posts",
+                count=len(posts),
+                error=str(e),
+            )
+            raise DatabaseError(f"Failed to create posts: {e}")
+
+    async def create_many_scheduled(
+        self,
+        posts: List[CompletedPost],
+        slots: List[Optional[Tuple[int, str, int]]],
+        schedule: Dict[str, Dict[str, float]]
+    ) -> Optional[List[CompletedPost]]:
+        """
+        Insert several posts in one transaction, scheduling those without a planned time.
+
+        Uses the create_scheduled_posts database function (migration 043). Posts
+        with a planned time are inserted first; then each slot, in order, takes
+        the next free time after the latest pending post on its platform. The
+        function locks the business asset's platforms until commit, so
+        concurrent workers never receive the same slot.
+
+        Args:
+            posts: Posts to insert
+            slots: Per post, None if it keeps its scheduled_posting_time, else
+                (slot number, platform whose schedule the slot follows, minutes
+                after the slot time). Posts sharing a slot number share its time.
+            schedule: Per platform, {"interval_hours": ..., "initial_delay_hours": ...}
+
+        Returns:
+            Created posts, in the same order as given, or None if the call failed
+        """
+        try:
+            from backend.database import get_supabase_admin_client
+            client = await get_supabase_admin_client()
+
+            # Full rows are sent since the function builds whole records; the
+            # client-side ids also make a repeated insert fail instead of
+            # duplicating posts
+            rows = []
+            for post, slot in zip(posts, slots):
+                row = post.model_dump(mode="json")
+                if slot is not None:
+                    row["slot"], row["slot_platform"], row["slot_offset_minutes"] = slot
+                rows.append(row)
+
+            result = await client.rpc(
+                "create_scheduled_posts",
+                {"p_posts": rows, "p_schedule": schedule}
+            ).execute()
+
+            if len(result.data) != len(posts):
+                raise DatabaseError(
+                    f"Expected {len(posts)} created posts, got {len(result.data)}"
+                )
+
+            # Planned posts come back first; restore the given order
+            created = {item["id"]: self.model_class(**item) for item in result.data}
+            return [created[str(post.id)] for post in posts]
+        except Exception as e:
+            from backend.utils import get_logger
+            logger = get_logger(__name__)
+            logger.error(
+                "Failed to create scheduled posts",
+                count=len(posts),
+                error=str(e),
+            )
+            return None
+
     async def get_pending_for_platform(
         self, business_asset_id: str, platform: Literal["facebook", "instagram"], limit: int = 10
     ) -> List[CompletedPost]:
@@ -193,6 +292,51 @@ class CompletedPostRepository(BaseRepository[CompletedPost]):
             )
             return []
 
+    async def get_latest_scheduled_time(
+        self, business_asset_id: str, platform: Literal["facebook", "instagram"]
+    ) -> Optional[datetime]:
+        """
+        Get the latest scheduled posting time among pending posts for a platform.
+
+        Lets Postgres pick the single latest row instead of transferring every
+        pending post.
+
+        Args:
+            business_asset_id: Business asset ID to filter by
+            platform: Platform to filter by
+
+        Returns:
+            Latest scheduled_posting_time, or None if no pending post is scheduled
+        """
+        try:
+            from backend.database import get_supabase_admin_client
+            client = await get_supabase_admin_client()
+
+            result = await (
+                client.table(self.table_name)
+                .select("scheduled_posting_time")
+                .eq("business_asset_id", business_asset_id)
+                .eq("platform", platform)
+                .eq("status", "pending")
+                .not_.is_("scheduled_posting_time", "null")
+                .order("scheduled_posting_time", desc=True)
+                .limit(1)
+                .execute()
+            )
+            if not result.data:
+                return None
+            return datetime.fromisoformat(result.data[0]["scheduled_posting_time"].replace("Z", "+00:00"))
+        except Exception as e:
+            from backend.utils import get_logger
+            logger = get_logger(__name__)
+            logger.error(
+                "Failed to get latest scheduled time",
+                business_asset_id=business_asset_id,
+                platform=platform,
+                error=str(e),
+            )
+            return None
+
     async def update_scheduled_time(
         self, business_asset_id: str, post_id: UUID, scheduled_posting_time: datetime
     ) -> CompletedPost | None:
@@ -2,7 +2,7 @@
 
 """Repository for platform comments."""
 
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 from backend.models import PlatformComment
 from .base import BaseRepository
@@ -69,6 +69,63 @@ class PlatformCommentRepository(BaseRepository[PlatformComment]):
             )
             return []
 
+    async def get_pending_comments_multi(
+        self,
+        business_asset_ids: List[str],
+        platform: Optional[Literal["facebook", "instagram"]] = None,
+        limit_per_asset: int = 50
+    ) -> Optional[Dict[str, List[PlatformComment]]]:
+        """
+        Get pending comments for several business assets in a single query.
+
+        Uses the get_pending_comments_multi database function (migration 041),
+        which applies the limit per asset rather than overall.
+
+        Args:
+            business_asset_ids: Business asset IDs to fetch comments for
+            platform: Optional platform filter ("facebook" or "instagram")
+            limit_per_asset: Maximum number of comments to return per asset
+
+        Returns:
+            Pending comments grouped by business asset ID, each ordered by
+            creation time (assets without pending comments are omitted),
+            or None if the query failed
+        """
+        try:
+            from backend.database import get_supabase_admin_client
+            client = await get_supabase_admin_client()
+
+            result = await client.rpc(
+                "get_pending_comments_multi",
+                {
+                    "p_business_asset_ids": business_asset_ids,
+                    "p_platform": platform,
+                    "p_limit_per_asset": limit_per_asset
+                }
+            ).execute()
+
+            grouped: Dict[str, List[PlatformComment]] = {}
+            for item in result.data:
+                comment = self.model_class(**item)
+                grouped.setdefault(comment.business_asset_id, []).append(comment)
+
+            logger.info(
+                "Retrieved pending comments for multiple assets",
+                asset_count=len(business_asset_ids),
+                platform=platform or "all",
+                count=len(result.data)
+            )
+
+            return grouped
+        except Exception as e:
+            logger.error(
+                "Failed to get pending comments for multiple assets",
+                asset_count=len(business_asset_ids),
+                platform=platform,
+                error=str(e)
+            )
+            return None
+
     async def get_by_comment_id(
         self,
         business_asset_id: str,
@@ -252,6 +309,84 @@ class PlatformCommentRepository(BaseRepository[PlatformComment]):
             )
             return None
 
+    async def apply_status_updates(
+        self,
+        business_asset_id: str,
+        updates: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Apply several comment status updates in a single database call.
+
+        Uses the apply_comment_status_updates database function (migration 042).
+        If that call fails, each update is applied individually through
+        mark_as_responded / mark_as_failed / mark_as_ignored so no outcome is lost.
+
+        Args:
+            business_asset_id: Business asset ID to filter by
+            updates: One dict per comment with "id" (record UUID), "status"
+                ("responded", "failed" or "ignored"), and the matching fields:
+                "response_text", "response_comment_id", "responded_at" for
+                responded comments; "error_message" and "retry_increment" for
+                failed ones
+
+        Returns:
+            Number of comment records updated
+        """
+        if not updates:
+            return 0
+
+        try:
+            from backend.database import get_supabase_admin_client
+            client = await get_supabase_admin_client()
+
+            payload = [
+                {**update, "id": str(update["id"]), "business_asset_id": business_asset_id}
+                for update in updates
+            ]
+            result = await client.rpc(
+                "apply_comment_status_updates",
+                {"p_updates": payload}
+            ).execute()
+
+            logger.info(
+                "Applied comment status updates",
+                business_asset_id=business_asset_id,
+                count=len(result.data)
+            )
+
+            return len(result.data)
+        except Exception as e:
+            logger.warning(
+                "Batched comment status update failed, applying individually",
+                business_asset_id=business_asset_id,
+                count=len(updates),
+                error=str(e)
+            )
+
+        updated = 0
+        for update in updates:
+            if update["status"] == "responded":
+                result = await self.mark_as_responded(
+                    business_asset_id=business_asset_id,
+                    comment_record_id=update["id"],
+                    response_text=update["response_text"],
+                    response_comment_id=update["response_comment_id"]
+                )
+            elif update["status"] == "failed":
+                result = await self.mark_as_failed(
+                    business_asset_id=business_asset_id,
+                    comment_record_id=update["id"],
+                    error_message=update["error_message"],
+                    increment_retry=bool(update.get("retry_increment"))
+                )
+            else:
+                result = await self.mark_as_ignored(business_asset_id, update["id"])
+
+            if result:
+                updated += 1
+
+        return updated
+
     async def get_comments_by_post(
         self,
         business_asset_id: str,
@@ -3,7 +3,8 @@
 """Base client for Meta Graph API."""
 
 import aiohttp
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional
 from backend.config import settings
 from backend.utils import get_logger, APIError
 
@@ -35,8 +36,37 @@ class MetaBaseClient:
         self.page_token = credentials.facebook_page_access_token
         self.ig_token = credentials.instagram_page_access_token
 
+        # Session shared by requests inside shared_session(); None otherwise
+        self._session: Optional[aiohttp.ClientSession] = None
+
         logger.debug(f"Initialized MetaBaseClient for business asset: {business_asset_id}")
 
+    @asynccontextmanager
+    async def shared_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Reuse a single HTTP session for all requests made inside this context.
+
+        Outside of it, each request opens its own session. Use this around
+        bursts of calls so they share one connection pool instead of paying a
+        TCP/TLS handshake per request. Nested scopes reuse the outer session.
+
+        Example:
+            ```python
+            async with client.shared_session():
+                await asyncio.gather(client.get_post_context(...), ...)
+            ```
+        """
+        if self._session is not None:
+            yield self._session
+            return
+
+        async with aiohttp.ClientSession() as session:
+            self._session = session
+            try:
+                yield session
+            finally:
+                self._session = None
+
     async def _make_request(
         self,
         method: str,
@@ -71,23 +101,43 @@ class MetaBaseClient:
         else:
             form_data = data
 
+        if self._session is not None:
+            return await self._send_request(
+                self._session, method, url, params, form_data, json_data, headers
+            )
+
         async with aiohttp.ClientSession() as session:
-            try:
-                async with session.request(
-                    method, url, params=params, data=form_data, json=json_data, headers=headers
-                ) as response:
-                    result = await response.json()
-
-                    if response.status != 200:
-                        error = result.get("error", {})
-                        error_msg = error.get("message", "Unknown error")
-                        raise APIError(
-                            f"Meta API error: {error_msg}",
-                            status_code=response.status,
-                            response_body=str(result),
-                        )
-
-                    return result
-
-            except aiohttp.ClientError as e:
-                raise APIError(f"Network error: {e}")
+            return await self._send_request(
+                session, method, url, params, form_data, json_data, headers
+            )
+
+    async def _send_request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        form_data: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Send a request on the given session and return the JSON response."""
+        try:
+            async with session.request(
+                method, url, params=params, data=form_data, json=json_data, headers=headers
+            ) as response:
+                result = await response.json()
+
+                if response.status != 200:
+                    error = result.get("error", {})
+                    error_msg = error.get("message", "Unknown error")
+                    raise APIError(
+                        f"Meta API error: {error_msg}",
+                        status_code=response.status,
+                        response_body=str(result),
+                    )
+
+                return result
+
+        except aiohttp.ClientError as e:
+            raise APIError(f"Network error: {e}")
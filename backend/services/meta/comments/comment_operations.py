@@ -37,14 +37,14 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Facebook post context", post_id=post_id)
+        logger.debug("Fetching Facebook post context", post_id=post_id)
 
         url = f"{self.BASE_URL}/{post_id}"
         params = {
             "fields": (
                 "message,from,created_time,permalink_url,"
                 "attachments{description,media_type,media,url,subattachments},"
-                "shares,privacy,updated_time"
+                "shares,privacy,updated_time,comments.limit(0).summary(true)"
             ),
             "access_token": self.page_token
         }
@@ -55,7 +55,7 @@ class CommentOperations(MetaBaseClient):
                 url,
                 data=params
             )
-            logger.info("Successfully fetched Facebook post context", post_id=post_id)
+            logger.debug("Successfully fetched Facebook post context", post_id=post_id)
             return result
         except Exception as e:
             raise APIError(f"Failed to fetch Facebook post context: {e}")
@@ -73,7 +73,7 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Facebook comment details", comment_id=comment_id)
+        logger.debug("Fetching Facebook comment details", comment_id=comment_id)
 
         url = f"{self.BASE_URL}/{comment_id}"
         params = {
@@ -90,17 +90,22 @@ class CommentOperations(MetaBaseClient):
                 url,
                 data=params
             )
-            logger.info("Successfully fetched Facebook comment", comment_id=comment_id)
+            logger.debug("Successfully fetched Facebook comment", comment_id=comment_id)
             return result
         except Exception as e:
             raise APIError(f"Failed to fetch Facebook comment: {e}")
 
-    async def get_facebook_post_comments(self, post_id: str) -> List[Dict[str, Any]]:
+    async def get_facebook_post_comments(
+        self,
+        post_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch all comments on a Facebook post.
 
         Args:
             post_id: Facebook post ID
+            limit: Optional maximum number of comments to fetch
 
         Returns:
             List of comment dictionaries
@@ -108,7 +113,7 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Facebook post comments", post_id=post_id)
+        logger.debug("Fetching Facebook post comments", post_id=post_id)
 
         url = f"{self.BASE_URL}/{post_id}/comments"
         params = {
@@ -119,6 +124,8 @@ class CommentOperations(MetaBaseClient):
             "filter": "stream",  # Include all comments and replies
             "access_token": self.page_token
         }
+        if limit:
+            params["limit"] = limit
 
         try:
             result = await self._make_request(
@@ -127,7 +134,7 @@ class CommentOperations(MetaBaseClient):
                 data=params
             )
             comments = result.get("data", [])
-            logger.info(
+            logger.debug(
                 "Successfully fetched Facebook post comments",
                 post_id=post_id,
                 count=len(comments)
@@ -232,13 +239,14 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Instagram media context", media_id=media_id)
+        logger.debug("Fetching Instagram media context", media_id=media_id)
 
         url = f"{self.INSTAGRAM_BASE_URL}/{media_id}"
         params = {
             "fields": (
                 "id,caption,media_type,media_url,thumbnail_url,permalink,"
-                "timestamp,username,owner,children{media_type,media_url,thumbnail_url}"
+                "timestamp,username,owner,comments_count,"
+                "children{media_type,media_url,thumbnail_url}"
             ),
             "access_token": self.ig_token
         }
@@ -249,17 +257,22 @@ class CommentOperations(MetaBaseClient):
                 url,
                 data=params
             )
-            logger.info("Successfully fetched Instagram media context", media_id=media_id)
+            logger.debug("Successfully fetched Instagram media context", media_id=media_id)
             return result
         except Exception as e:
             raise APIError(f"Failed to fetch Instagram media context: {e}")
 
-    async def get_instagram_media_comments(self, media_id: str) -> List[Dict[str, Any]]:
+    async def get_instagram_media_comments(
+        self,
+        media_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch all comments on an Instagram media post.
 
         Args:
             media_id: Instagram media ID
+            limit: Optional maximum number of comments to fetch
 
         Returns:
             List of comment dictionaries with replies nested
@@ -267,7 +280,7 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Instagram media comments", media_id=media_id)
+        logger.debug("Fetching Instagram media comments", media_id=media_id)
 
         url = f"{self.INSTAGRAM_BASE_URL}/{media_id}/comments"
         params = {
@@ -276,6 +289,8 @@ class CommentOperations(MetaBaseClient):
             "fields": "id,text,username,timestamp,from,like_count",
             "access_token": self.ig_token
         }
+        if limit:
+            params["limit"] = limit
 
         try:
             result = await self._make_request(
@@ -284,7 +299,7 @@ class CommentOperations(MetaBaseClient):
                 data=params
             )
             comments = result.get("data", [])
-            logger.info(
+            logger.debug(
                 "Successfully fetched Instagram media comments",
                 media_id=media_id,
                 count=len(comments)
@@ -306,7 +321,7 @@ class CommentOperations(MetaBaseClient):
         Raises:
             APIError: If request fails
         """
-        logger.info("Fetching Instagram comment details", comment_id=comment_id)
+        logger.debug("Fetching Instagram comment details", comment_id=comment_id)
 
         url = f"{self.INSTAGRAM_BASE_URL}/{comment_id}"
         params = {
@@ -323,7 +338,7 @@ class CommentOperations(MetaBaseClient):
                 url,
                 data=params
             )
-            logger.info("Successfully fetched Instagram comment", comment_id=comment_id)
+            logger.debug("Successfully fetched Instagram comment", comment_id=comment_id)
             return result
         except Exception as e:
             raise APIError(f"Failed to fetch Instagram comment: {e}")
@@ -433,7 +448,8 @@ class CommentOperations(MetaBaseClient):
     async def get_all_comments(
         self,
         platform: str,
-        post_id: str
+        post_id: str,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Unified method to get all comments for either platform.
@@ -441,6 +457,7 @@ class CommentOperations(MetaBaseClient):
         Args:
             platform: "facebook" or "instagram"
             post_id: Platform-specific post/media ID
+            limit: Optional maximum number of comments to fetch
 
         Returns:
             List of comment dictionaries
@@ -450,9 +467,9 @@ class CommentOperations(MetaBaseClient):
             APIError: If request fails
         """
         if platform == "facebook":
-            return await self.get_facebook_post_comments(post_id)
+            return await self.get_facebook_post_comments(post_id, limit=limit)
         elif platform == "instagram":
-            return await self.get_instagram_media_comments(post_id)
+            return await self.get_instagram_media_comments(post_id, limit=limit)
         else:
             raise ValueError(f"Invalid platform: {platform}. Must be 'facebook' or 'instagram'")
 
@@ -7,6 +7,8 @@ Supabase storage operations for generated media.
 from datetime import datetime, timezone
 from uuid import uuid4
 from pathlib import Path
+from io import BufferedReader, FileIO
+from typing import Union
 from backend.database import get_supabase_admin_client
 from backend.utils import get_logger
 from backend.models import Image, Video
@@ -150,7 +152,7 @@ class StorageService:
     async def upload_media(
         self,
         storage_path: str,
-        media_bytes: bytes,
+        media_bytes: Union[bytes, BufferedReader, FileIO],
         content_type: str,
     ) -> str:
         """
@@ -161,13 +163,18 @@ class StorageService:
 
         Args:
             storage_path: Full path in storage bucket (e.g., "ai-generated/images/file.png")
-            media_bytes: Media data
+            media_bytes: Media data, or a file opened with open(..., "rb") to stream from.
+                         Other file-like objects are not streamed by storage3.
             content_type: MIME type (e.g., "image/png", "video/mp4")
 
         Returns:
             Public URL of uploaded media
         """
-        logger.info("Uploading media to Supabase", path=storage_path, size=len(media_bytes))
+        logger.info(
+            "Uploading media to Supabase",
+            path=storage_path,
+            size=len(media_bytes) if isinstance(media_bytes, bytes) else None,
+        )
 
         try:
             client = await get_supabase_admin_client()
@@ -189,6 +196,22 @@ class StorageService:
             logger.error("Failed to upload media", error=str(e))
             raise
 
+    async def get_public_url(self, storage_path: str) -> str:
+        """
+        Build the public URL for a storage path.
+
+        The URL is derived from the path alone, so this can be called
+        before the file has been uploaded.
+
+        Args:
+            storage_path: Full path in storage bucket
+
+        Returns:
+            Public URL of the media
+        """
+        client = await get_supabase_admin_client()
+        return await client.storage.from_(self.BUCKET_NAME).get_public_url(storage_path)
+
     async def delete_media(self, storage_path: str) -> bool:
         """
         Delete media from storage.
@@ -215,7 +238,7 @@ class StorageService:
         """
         try:
             client = await get_supabase_admin_client()
-            client.storage.from_(self.BUCKET_NAME).remove([storage_path])
+            await client.storage.from_(self.BUCKET_NAME).remove([storage_path])
             logger.info("File deleted", path=storage_path)
             return True
         except Exception as e:
@@ -7,7 +7,7 @@ Handles authentication, request submission, and polling.
 
 import asyncio
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Optional
 from backend.config import settings
 from backend.utils import get_logger, APIError, MediaGenerationError
 
@@ -16,6 +16,9 @@ logger = get_logger(__name__)
 # Transient error patterns that are safe to retry
 TRANSIENT_ERROR_PATTERNS = ["Internal Error", "Please try again", "temporarily unavailable"]
 
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 class WavespeedBaseClient:
     """Base client for Wavespeed AI API operations."""
@@ -189,3 +192,41 @@ class WavespeedBaseClient:
 
             except aiohttp.ClientError as e:
                 raise MediaGenerationError(f"Network error during media download: {e}")
+
+    async def download_to_file(self, url: str, file: BinaryIO) -> int:
+        """
+        Stream generated media from temporary URL into a file.
+
+        Only one chunk is held in memory at a time. The file is rewound to
+        the start afterwards so it can be uploaded directly.
+
+        Args:
+            url: Temporary URL from Wavespeed
+            file: Writable binary file object
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            MediaGenerationError: If download fails
+        """
+        async with aiohttp.ClientSession() as session:
+            try:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        raise MediaGenerationError(
+                            f"Failed to download media from {url} (HTTP {response.status})",
+                            status_code=response.status,
+                        )
+
+                    size_bytes = 0
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+                        size_bytes += len(chunk)
+
+                    file.seek(0)
+                    logger.info("Downloaded media", size_bytes=size_bytes)
+                    return size_bytes
+
+            except aiohttp.ClientError as e:
+                raise MediaGenerationError(f"Network error during media download: {e}")
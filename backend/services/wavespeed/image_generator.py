@@ -57,7 +57,41 @@ class ImageGenerator(WavespeedBaseClient):
         num_inference_steps: int = 28,
     ) -> bytes:
         """
-        Generate an image.
+        Generate an image and download it.
+
+        Args are the same as generate_url().
+
+        Returns:
+            Image bytes (PNG)
+
+        Raises:
+            MediaGenerationError: If generation fails
+        """
+        output_url = await self.generate_url(
+            prompt,
+            size,
+            negative_prompt=negative_prompt,
+            guidance_scale=guidance_scale,
+            num_inference_steps=num_inference_steps,
+        )
+
+        # Download image
+        image_bytes = await self._download_media(output_url)
+
+        return image_bytes
+
+    async def generate_url(
+        self,
+        prompt: str,
+        size: Union[ImageSize, str] = None,
+        negative_prompt: str = "",
+        guidance_scale: float = 3.5,
+        num_inference_steps: int = 28,
+    ) -> str:
+        """
+        Generate an image without downloading it.
+
+        Use download_to_file() to stream the result from the returned URL.
 
         Args:
             prompt: Text prompt for generation
@@ -69,7 +103,7 @@ class ImageGenerator(WavespeedBaseClient):
             num_inference_steps: Denoising steps (only used by sdxl-lora, range 1-50)
 
         Returns:
-            Image bytes (PNG)
+            Temporary URL to the generated image (PNG)
 
         Raises:
             MediaGenerationError: If generation fails
@@ -99,9 +133,4 @@ class ImageGenerator(WavespeedBaseClient):
         )
 
         # Submit task and poll for completion with retry on transient errors
-        output_url = await self._submit_and_poll_with_retry(self.model_id, payload)
-
-        # Download image
-        image_bytes = await self._download_media(output_url)
-
-        return image_bytes
+        return await self._submit_and_poll_with_retry(self.model_id, payload)
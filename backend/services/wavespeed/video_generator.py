@@ -52,7 +52,43 @@ class VideoGenerator(WavespeedBaseClient):
         duration: Optional[int] = None,
     ) -> bytes:
         """
-        Generate a video from a text prompt.
+        Generate a video from a text prompt and download it.
+
+        Args are the same as generate_url().
+
+        Returns:
+            Video bytes (MP4)
+
+        Raises:
+            MediaGenerationError: If generation fails
+        """
+        output_url = await self.generate_url(
+            prompt,
+            size,
+            aspect_ratio=aspect_ratio,
+            camera_fixed=camera_fixed,
+            seed=seed,
+            duration=duration,
+        )
+
+        # Download video
+        video_bytes = await self._download_media(output_url)
+
+        return video_bytes
+
+    async def generate_url(
+        self,
+        prompt: str,
+        size: str = "1280*720",
+        aspect_ratio: str = "16:9",
+        camera_fixed: bool = False,
+        seed: int = -1,
+        duration: Optional[int] = None,
+    ) -> str:
+        """
+        Generate a video from a text prompt without downloading it.
+
+        Use download_to_file() to stream the result from the returned URL.
 
         Args:
             prompt: Text prompt describing the desired video content
@@ -64,7 +100,7 @@ class VideoGenerator(WavespeedBaseClient):
                       (e.g. GrokVideoConfig: 6 or 10). Ignored by other models.
 
         Returns:
-            Video bytes (MP4)
+            Temporary URL to the generated video (MP4)
 
         Raises:
             MediaGenerationError: If generation fails
@@ -90,9 +126,4 @@ class VideoGenerator(WavespeedBaseClient):
         )
 
         # Submit task and poll for completion with retry on transient errors
-        output_url = await self._submit_and_poll_with_retry(self.model_id, payload)
-
-        # Download video
-        video_bytes = await self._download_media(output_url)
-
-        return video_bytes
+        return await self._submit_and_poll_with_retry(self.model_id, payload)
@@ -0,0 +1,213 @@
+# backend/tests/test_comment_responder_runner.py
+
+"""
+Unit tests for the comment responder runner.
+Pending comments are loaded through the real PostgREST client with a stubbed
+transport; the agent, Meta API and per-asset runs are stubbed.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.agents.comment_responder import runner
+from backend.agents.comment_responder.runner import run_comment_responder_all_assets
+from backend.models import PlatformComment
+
+RPC_PATH = "/rpc/get_pending_comments_multi"
+ASSETS = [SimpleNamespace(id="asset-a", name="Asset A"), SimpleNamespace(id="asset-b", name="Asset B")]
+
+
+def pending_comment_row(business_asset_id: str, comment_id: str) -> dict:
+    return {
+        "id": str(uuid4()),
+        "business_asset_id": business_asset_id,
+        "platform": "instagram",
+        "comment_id": comment_id,
+        "post_id": "post-1",
+        "comment_text": "Nice post!",
+        "commenter_username": "fan",
+        "commenter_id": "user-1",
+        "created_time": datetime(2030, 1, 1, tzinfo=timezone.utc).isoformat(),
+        "status": "pending",
+    }
+
+
+@pytest.fixture
+def asset_runs(monkeypatch):
+    """
+    Stub asset lookup and per-asset runs.
+
+    Returns:
+        AsyncMock standing in for run_comment_responder
+    """
+    asset_repo = MagicMock()
+    asset_repo.get_all_active.return_value = ASSETS
+    monkeypatch.setattr(runner, "BusinessAssetRepository", MagicMock(return_value=asset_repo))
+    run_one = AsyncMock(return_value={"responded": 1, "failed": 0, "ignored": 0})
+    monkeypatch.setattr(runner, "run_comment_responder", run_one)
+    return run_one
+
+
+def pending_comments_by_asset(run_one) -> dict:
+    """Map each asset to the pending_comments its run received."""
+    return {
+        call.kwargs["business_asset_id"]: call.kwargs["pending_comments"]
+        for call in run_one.await_args_list
+    }
+
+
+async def test_all_assets_share_one_pending_comments_query(postgrest, asset_runs):
+    """Each asset runs on its slice of one grouped query; assets without comments get []."""
+    postgrest.respond(RPC_PATH, json=[
+        pending_comment_row("asset-a", "c1"),
+        pending_comment_row("asset-a", "c2"),
+    ])
+
+    results = await run_comment_responder_all_assets(limit_per_asset=5, fetch_instagram_first=False)
+
+    [(_, _, _, body)] = postgrest.calls(RPC_PATH)
+    assert json.loads(body) == {
+        "p_business_asset_ids": ["asset-a", "asset-b"],
+        "p_platform": None,
+        "p_limit_per_asset": 5,
+    }
+    pending = pending_comments_by_asset(asset_runs)
+    assert [comment.comment_id for comment in pending["asset-a"]] == ["c1", "c2"]
+    assert pending["asset-b"] == []
+    assert results["assets_processed"] == 2
+    assert results["total_responded"] == 2
+
+
+async def test_failed_grouped_query_falls_back_to_per_asset_queries(postgrest, asset_runs):
+    """When the grouped query fails, each asset run loads its own comments (None)."""
+    postgrest.respond(RPC_PATH, status_code=404, json={
+        "code": "PGRST202",
+        "message": "Could not find the function public.get_pending_comments_multi"
+    })
+
+    results = await run_comment_responder_all_assets(limit_per_asset=5, fetch_instagram_first=False)
+
+    assert pending_comments_by_asset(asset_runs) == {"asset-a": None, "asset-b": None}
+    assert results["assets_processed"] == 2
+
+
+@pytest.mark.parametrize("pending_comments, expected_queries", [(None, 1), ([], 0)])
+async def test_run_queries_pending_comments_only_when_not_given(pending_comments, expected_queries):
+    """None means the run loads its own pending comments; a list (even empty) is used as is."""
+    comment_runner = runner.CommentResponderRunner.__new__(runner.CommentResponderRunner)
+    comment_runner.business_asset_id = "asset-a"
+    comment_runner.max_comments_per_run = 5
+    comment_runner.comment_repo = MagicMock()
+    comment_runner.comment_repo.get_pending_comments = AsyncMock(return_value=[])
+
+    await comment_runner.run(fetch_instagram_first=False, pending_comments=pending_comments)
+
+    assert comment_runner.comment_repo.get_pending_comments.await_count == expected_queries
+
+
+@pytest.fixture
+def comment_runner():
+    """CommentResponderRunner with stubbed agent, Meta client and repository."""
+    comment_runner = runner.CommentResponderRunner.__new__(runner.CommentResponderRunner)
+    comment_runner.business_asset_id = "asset-a"
+    comment_runner.max_concurrency = 2
+    comment_runner.semaphore = asyncio.Semaphore(2)
+    comment_runner._post_cache = {}
+    comment_runner._status_updates = []
+    comment_runner.agent = MagicMock()
+    comment_runner.agent.prepare = AsyncMock(return_value={"comment": "prompt"})
+    comment_runner.agent.postprocess = MagicMock(side_effect=lambda comment, raw: raw)
+
+    async def reply_to_comment(platform, comment_id, message):
+        await asyncio.sleep(0.05)
+        return f"reply-{comment_id}"
+
+    comment_runner.comment_ops = MagicMock()
+    comment_runner.comment_ops.get_post_context = AsyncMock(return_value={})
+    comment_runner.comment_ops.get_all_comments = AsyncMock(return_value=[])
+    comment_runner.comment_ops.reply_to_comment = AsyncMock(side_effect=reply_to_comment)
+    comment_runner.comment_repo = MagicMock()
+    comment_runner.comment_repo.mark_as_responded = AsyncMock(return_value=MagicMock())
+    comment_runner.comment_repo.apply_status_updates = AsyncMock(return_value=0)
+    return comment_runner
+
+
+def make_comments(*comment_ids):
+    return [PlatformComment(**pending_comment_row("asset-a", comment_id)) for comment_id in comment_ids]
+
+
+def generations(*items, error=None):
+    """Stand-in for chain.abatch_as_completed yielding items, then optionally raising."""
+    async def abatch_as_completed(inputs, config=None, return_exceptions=False):
+        for item in items:
+            yield item
+        if error:
+            raise error
+    return abatch_as_completed
+
+
+async def test_responded_is_written_right_after_posting(comment_runner):
+    """Posted replies are marked responded at once; only other outcomes wait for the batch."""
+    comments = make_comments("c1", "c2")
+    comment_runner.agent.chain.abatch_as_completed = generations((0, "Thanks!"), (1, None))
+    results = {"processed": 0, "responded": 0, "failed": 0, "ignored": 0, "errors": []}
+
+    await comment_runner._respond_to_comments(comments, results)
+
+    comment_runner.comment_repo.mark_as_responded.assert_awaited_once_with(
+        business_asset_id="asset-a",
+        comment_record_id=comments[0].id,
+        response_text="Thanks!",
+        response_comment_id="reply-c1"
+    )
+    comment_runner.comment_repo.apply_status_updates.assert_awaited_once_with(
+        "asset-a", [{"id": comments[1].id, "status": "ignored"}]
+    )
+    assert results["responded"] == 1
+    assert results["ignored"] == 1
+
+
+async def test_failed_responded_write_is_retried_in_batch(comment_runner):
+    comments = make_comments("c1")
+    comment_runner.agent.chain.abatch_as_completed = generations((0, "Thanks!"))
+    comment_runner.comment_repo.mark_as_responded = AsyncMock(return_value=None)
+    results = {"processed": 0, "responded": 0, "failed": 0, "ignored": 0, "errors": []}
+
+    await comment_runner._respond_to_comments(comments, results)
+
+    [(business_asset_id, updates)] = [call.args for call in comment_runner.comment_repo.apply_status_updates.await_args_list]
+    assert [(update["id"], update["status"], update["response_comment_id"]) for update in updates] == [
+        (comments[0].id, "responded", "reply-c1")
+    ]
+
+
+async def test_generation_error_lets_in_flight_reply_finish(comment_runner):
+    """A reply being posted when generation fails is still recorded."""
+    comments = make_comments("c1", "c2")
+    comment_runner.agent.chain.abatch_as_completed = generations((0, "Thanks!"), error=RuntimeError("LLM down"))
+    results = {"processed": 0, "responded": 0, "failed": 0, "ignored": 0, "errors": []}
+
+    with pytest.raises(RuntimeError, match="LLM down"):
+        await comment_runner._respond_to_comments(comments, results)
+
+    comment_runner.comment_ops.reply_to_comment.assert_awaited_once()
+    comment_runner.comment_repo.mark_as_responded.assert_awaited_once()
+    assert results["responded"] == 1
+
+
+async def test_prefetch_skips_posts_with_only_spam_comments(comment_runner):
+    """Posts whose pending comments are all spam are never fetched."""
+    genuine, spam = make_comments("c1", "c2")
+    spam.post_id = "post-2"
+    spam.comment_text = "Click here for FREE MONEY"
+
+    await comment_runner._prefetch_posts([genuine, spam])
+
+    comment_runner.comment_ops.get_post_context.assert_awaited_once_with(platform="instagram", post_id="post-1")
+    assert list(comment_runner._post_cache) == [("instagram", "post-1")]
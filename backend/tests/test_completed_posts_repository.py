@@ -0,0 +1,181 @@
+# backend/tests/test_completed_posts_repository.py
+
+"""
+Tests for scheduling posts on insert with CompletedPostRepository.
+Unit tests run the real PostgREST client against a stubbed transport.
+Integration tests exercise create_scheduled_posts (migration 043) on a real database.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from backend.database.repositories.completed_posts import CompletedPostRepository
+from backend.database.repositories.content_creation_tasks import ContentCreationTaskRepository
+from backend.database.repositories.ungrounded_seeds import UngroundedSeedRepository
+from backend.models.posts import CompletedPost
+from backend.models.seeds import UngroundedSeed
+from backend.models.tasks import ContentCreationTask
+
+from .conftest import skip_if_no_supabase
+
+BUSINESS_ASSET_ID = "test-asset"
+RPC_PATH = "/rpc/create_scheduled_posts"
+POSTS_PATH = "/completed_posts"
+MISSING_FUNCTION = {"code": "PGRST202", "message": "Could not find the function public.create_scheduled_posts"}
+SCHEDULE = {platform: {"interval_hours": 5, "initial_delay_hours": 0} for platform in ("instagram", "facebook")}
+
+
+def make_post(platform: str, text: str, scheduled_posting_time=None, business_asset_id=BUSINESS_ASSET_ID, **ids):
+    return CompletedPost(
+        business_asset_id=business_asset_id,
+        task_id=ids.get("task_id", uuid4()),
+        ungrounded_seed_id=ids.get("ungrounded_seed_id", uuid4()),
+        platform=platform,
+        post_type="instagram_image" if platform == "instagram" else "facebook_feed",
+        text=text,
+        scheduled_posting_time=scheduled_posting_time,
+    )
+
+
+async def test_create_many_scheduled_sends_rows_with_slots(postgrest):
+    """Planned posts are sent as is; unplanned ones carry their slot."""
+    planned = make_post("instagram", "planned", datetime(2030, 1, 1, 10, tzinfo=timezone.utc))
+    unplanned = make_post("facebook", "unplanned")
+    # The function returns planned posts first, whatever the given order
+    postgrest.respond(RPC_PATH, json=[
+        planned.model_dump(mode="json"),
+        {**unplanned.model_dump(mode="json"), "scheduled_posting_time": "2030-01-01T15:30:00+00:00"},
+    ])
+
+    created = await CompletedPostRepository().create_many_scheduled(
+        [unplanned, planned], [(0, "instagram", 30), None], SCHEDULE
+    )
+
+    assert [post.id for post in created] == [unplanned.id, planned.id]
+    assert created[0].scheduled_posting_time == datetime(2030, 1, 1, 15, 30, tzinfo=timezone.utc)
+    [(method, _, _, body)] = postgrest.calls(RPC_PATH)
+    assert method == "POST"
+    params = json.loads(body)
+    assert params["p_schedule"] == SCHEDULE
+    unplanned_row, planned_row = params["p_posts"]
+    assert unplanned_row["id"] == str(unplanned.id)
+    assert (unplanned_row["slot"], unplanned_row["slot_platform"], unplanned_row["slot_offset_minutes"]) == (
+        0, "instagram", 30
+    )
+    assert planned_row["scheduled_posting_time"] == "2030-01-01T10:00:00Z"
+    assert "slot" not in planned_row
+
+
+async def test_create_many_scheduled_returns_none_when_rpc_fails(postgrest):
+    """A missing function (migration 043 not applied) yields None instead of raising."""
+    postgrest.respond(RPC_PATH, status_code=404, json=MISSING_FUNCTION)
+
+    created = await CompletedPostRepository().create_many_scheduled(
+        [make_post("facebook", "unplanned")], [(0, "facebook", 0)], SCHEDULE
+    )
+
+    assert created is None
+
+
+async def test_get_latest_scheduled_time_queries_single_latest_pending(postgrest):
+    """Only the latest pending, scheduled post is requested."""
+    postgrest.respond(POSTS_PATH, json=[{"scheduled_posting_time": "2030-01-01T10:00:00+00:00"}])
+
+    latest = await CompletedPostRepository().get_latest_scheduled_time(BUSINESS_ASSET_ID, "instagram")
+
+    assert latest == datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+    [(method, _, params, _)] = postgrest.calls(POSTS_PATH)
+    assert method == "GET"
+    assert params == {
+        "select": "scheduled_posting_time",
+        "business_asset_id": f"eq.{BUSINESS_ASSET_ID}",
+        "platform": "eq.instagram",
+        "status": "eq.pending",
+        "scheduled_posting_time": "not.is.null",
+        "order": "scheduled_posting_time.desc",
+        "limit": "1",
+    }
+
+
+async def test_get_latest_scheduled_time_returns_none_without_posts(postgrest):
+    postgrest.respond(POSTS_PATH, json=[])
+
+    assert await CompletedPostRepository().get_latest_scheduled_time(BUSINESS_ASSET_ID, "instagram") is None
+
+
+# Integration tests against the create_scheduled_posts database function
+
+@pytest.fixture
+async def scratch_task():
+    """
+    Throwaway business asset with a seed and task to attach posts to.
+
+    Keeps test posts out of real schedules; everything is deleted afterwards.
+    """
+    from backend.database import get_supabase_admin_client
+    client = await get_supabase_admin_client()
+    business_asset_id = f"pytest-{uuid4().hex[:8]}"
+    await client.table("business_assets").insert({
+        "id": business_asset_id,
+        "name": "Pytest scheduling",
+        "facebook_page_id": "0",
+        "app_users_instagram_account_id": "0",
+        "facebook_page_access_token_encrypted": "unused",
+        "instagram_page_access_token_encrypted": "unused",
+        "target_audience": "Nobody",
+        "is_active": False,
+    }).execute()
+    seed = await UngroundedSeedRepository().create(UngroundedSeed(
+        business_asset_id=business_asset_id, idea="Idea", format="Photo", details="Details", created_by="pytest"
+    ))
+    task = await ContentCreationTaskRepository().create(ContentCreationTask(
+        business_asset_id=business_asset_id, ungrounded_seed_id=seed.id, image_posts=1, image_budget=1
+    ))
+    yield {"business_asset_id": business_asset_id, "task_id": task.id, "ungrounded_seed_id": seed.id}
+    await client.table("completed_posts").delete().eq("business_asset_id", business_asset_id).execute()
+    await ContentCreationTaskRepository().delete(business_asset_id, task.id)
+    await UngroundedSeedRepository().delete(business_asset_id, seed.id)
+    await client.table("business_assets").delete().eq("id", business_asset_id).execute()
+
+
+@pytest.mark.integration
+@skip_if_no_supabase
+async def test_concurrent_inserts_get_distinct_slots(scratch_task):
+    """Concurrent workers each receive their own slot, one interval apart."""
+    repo = CompletedPostRepository()
+
+    created = await asyncio.gather(*[
+        repo.create_many_scheduled([make_post("instagram", f"Post {i}", **scratch_task)], [(0, "instagram", 0)], SCHEDULE)
+        for i in range(5)
+    ])
+
+    slots = sorted(posts[0].scheduled_posting_time for posts in created)
+    assert len(set(slots)) == len(slots)
+    assert all(later - earlier == timedelta(hours=5) for earlier, later in zip(slots, slots[1:]))
+
+
+@pytest.mark.integration
+@skip_if_no_supabase
+async def test_slots_follow_pending_posts_only(scratch_task):
+    """Slots follow the latest pending post, and deleted posts give their time back."""
+    repo = CompletedPostRepository()
+    planned_time = (datetime.now(timezone.utc) + timedelta(days=2)).replace(microsecond=0)
+
+    created = await repo.create_many_scheduled(
+        [make_post("instagram", "Planned", planned_time, **scratch_task), make_post("instagram", "Slot", **scratch_task)],
+        [None, (0, "instagram", 0)],
+        SCHEDULE
+    )
+    assert created[1].scheduled_posting_time == planned_time + timedelta(hours=5)
+
+    for post in created:
+        await repo.delete(scratch_task["business_asset_id"], post.id)
+    before = datetime.now(timezone.utc) - timedelta(minutes=1)
+    [rescheduled] = await repo.create_many_scheduled(
+        [make_post("instagram", "Slot", **scratch_task)], [(0, "instagram", 0)], SCHEDULE
+    )
+    assert before <= rescheduled.scheduled_posting_time <= datetime.now(timezone.utc) + timedelta(minutes=1)
@@ -0,0 +1,306 @@
+# backend/tests/test_content_agent.py
+
+"""
+Unit tests for ContentCreationAgent media storage and post scheduling.
+Repositories, media services and the database API are stubbed; no LLM or database calls are made.
+"""
+
+import asyncio
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.agents.content_creation.content_agent import (
+    AgentResponse,
+    ContentCreationAgent,
+    MediaGenerationSpec,
+    UnifiedPostOutput,
+    _get_wavespeed_semaphores,
+)
+from backend.database.repositories.completed_posts import CompletedPostRepository
+from backend.config.settings import settings
+from backend.models.media import Image
+from backend.models.seeds import UngroundedSeed
+from backend.models.tasks import ContentCreationTask
+from backend.services.supabase.storage import StorageService
+from backend.utils import TaskFailedError
+
+BUSINESS_ASSET_ID = "test-asset"
+
+
+@pytest.fixture
+def agent():
+    """ContentCreationAgent with stubbed repositories, skipping LLM setup."""
+    agent = ContentCreationAgent.__new__(ContentCreationAgent)
+    agent.business_asset_id = BUSINESS_ASSET_ID
+    agent.share_media = True
+    agent.media_repo = MagicMock()
+    agent.media_repo.create_image = AsyncMock(side_effect=lambda media: media)
+    agent.storage_service = StorageService()
+    return agent
+
+
+def make_image() -> Image:
+    storage_path = f"ai-generated/images/{uuid4().hex[:8]}.png"
+    return Image(
+        business_asset_id=BUSINESS_ASSET_ID,
+        storage_path=storage_path,
+        public_url=f"http://storage.test/{storage_path}",
+        prompt="A red circle",
+        file_size=9,
+        mime_type="image/png"
+    )
+
+
+def temp_media_file(content: bytes):
+    """Temp file positioned at the end, as left by download_to_file before its seek."""
+    media_file = tempfile.TemporaryFile()
+    media_file.write(content)
+    return media_file
+
+
+async def test_upload_and_save_media_streams_temp_file(agent, storage_uploads):
+    """A TemporaryFile is uploaded through storage3 and the row is saved."""
+    image = make_image()
+
+    with temp_media_file(b"png-bytes") as media_file:
+        saved = await agent._upload_and_save_media(media_file, image, agent.media_repo.create_image)
+
+    assert saved is image
+    assert len(storage_uploads) == 1
+    assert b"png-bytes" in storage_uploads[0]
+    agent.media_repo.create_image.assert_awaited_once_with(image)
+
+
+async def test_upload_failure_skips_insert(agent):
+    """No row is written when the upload fails."""
+    agent.storage_service = MagicMock()
+    agent.storage_service.upload_media = AsyncMock(side_effect=RuntimeError("upload failed"))
+    agent.storage_service.delete_media = AsyncMock(return_value=True)
+
+    with temp_media_file(b"png-bytes") as media_file:
+        with pytest.raises(RuntimeError, match="upload failed"):
+            await agent._upload_and_save_media(media_file, make_image(), agent.media_repo.create_image)
+
+    agent.media_repo.create_image.assert_not_awaited()
+    agent.storage_service.delete_media.assert_not_awaited()
+
+
+async def test_insert_failure_removes_uploaded_file(agent):
+    """The uploaded object is deleted when the row insert fails."""
+    image = make_image()
+    agent.storage_service = MagicMock()
+    agent.storage_service.upload_media = AsyncMock(return_value=image.public_url)
+    agent.storage_service.delete_media = AsyncMock(return_value=True)
+    agent.media_repo.create_image = AsyncMock(side_effect=RuntimeError("insert failed"))
+
+    with temp_media_file(b"png-bytes") as media_file:
+        with pytest.raises(RuntimeError, match="insert failed"):
+            await agent._upload_and_save_media(media_file, image, agent.media_repo.create_image)
+
+    agent.storage_service.upload_media.assert_awaited_once()
+    agent.storage_service.delete_media.assert_awaited_once_with(image.storage_path)
+
+
+def make_task(scheduled_times=None, image_budget=3) -> ContentCreationTask:
+    return ContentCreationTask(
+        business_asset_id=BUSINESS_ASSET_ID,
+        ungrounded_seed_id=uuid4(),
+        image_posts=3,
+        image_budget=image_budget,
+        scheduled_times=scheduled_times or []
+    )
+
+
+def image_post(text: str) -> UnifiedPostOutput:
+    return UnifiedPostOutput(
+        format_type="image",
+        text=text,
+        media_specs=[MediaGenerationSpec(media_type="image", prompt=f"Image for {text}")]
+    )
+
+
+@pytest.fixture
+def task_agent(agent):
+    """
+    Agent wired to run create_content_for_task end to end.
+
+    The agent returns posts "first", "second" and "third". Media for "first"
+    fails, and media for "second" finishes after media for "third".
+    """
+    agent.tasks_repo = MagicMock()
+    agent.tasks_repo.update = AsyncMock()
+    agent._seed_fetchers = {
+        "ungrounded": AsyncMock(return_value=UngroundedSeed(
+            business_asset_id=BUSINESS_ASSET_ID,
+            idea="Idea",
+            format="Photo",
+            details="Details",
+            created_by="pytest"
+        ))
+    }
+    agent.agent_executor = MagicMock()
+    agent.agent_executor.ainvoke = AsyncMock(return_value={
+        "messages": [],
+        "structured_response": AgentResponse(
+            posts=[image_post("first"), image_post("second"), image_post("third")]
+        ),
+    })
+
+    async def generate_media(unified_post, task_id):
+        if unified_post.text == "first":
+            raise RuntimeError("generation failed")
+        await asyncio.sleep(0.05 if unified_post.text == "second" else 0)
+        return [uuid4()]
+
+    agent._generate_all_media_for_post = generate_media
+    agent.posts_repo = MagicMock()
+    agent.posts_repo.create_many = AsyncMock(side_effect=lambda posts: posts)
+    agent._post_creation_lock = asyncio.Lock()
+    agent._schedule_cursor = {}
+    agent._media_tasks = {}
+    agent._active_tasks = 0
+    return agent
+
+
+def instagram_times(posts):
+    """Map each Instagram post's caption to its scheduled time."""
+    return {
+        post["text"].split("\n")[0]: datetime.fromisoformat(post["scheduled_posting_time"])
+        for post in posts
+        if post["platform"] == "instagram"
+    }
+
+
+def echo_posts(posts, slots, schedule):
+    return posts
+
+
+async def test_planned_times_follow_successful_posts_in_order(task_agent):
+    """Planned times go to successfully built posts in the agent's order."""
+    planned = ["2030-01-01T10:00:00Z", "2030-01-01T15:00:00Z", "2030-01-01T20:00:00Z"]
+    task = make_task(scheduled_times=planned)
+    task_agent.posts_repo.create_many_scheduled = AsyncMock(side_effect=echo_posts)
+
+    posts = await task_agent.create_content_for_task(str(task.id), task=task)
+
+    assert instagram_times(posts) == {
+        "second": datetime(2030, 1, 1, 10, tzinfo=timezone.utc),
+        "third": datetime(2030, 1, 1, 15, tzinfo=timezone.utc),
+    }
+    _, slots, _ = task_agent.posts_repo.create_many_scheduled.await_args.args
+    assert slots == [None] * 4
+
+
+async def test_slots_follow_output_order(task_agent):
+    """Unplanned posts get slots in the agent's order, not media completion order."""
+    task = make_task()
+    task_agent.posts_repo.create_many_scheduled = AsyncMock(side_effect=echo_posts)
+
+    await task_agent.create_content_for_task(str(task.id), task=task)
+
+    posts, slots, schedule = task_agent.posts_repo.create_many_scheduled.await_args.args
+    assert [(post.text.split("\n")[0], post.platform) for post in posts] == [
+        ("second", "instagram"), ("second", "facebook"), ("third", "instagram"), ("third", "facebook")
+    ]
+    # Each Facebook post shares its Instagram post's slot, 30 minutes later
+    assert slots == [(0, "instagram", 0), (0, "instagram", 30), (1, "instagram", 0), (1, "instagram", 30)]
+    assert schedule["instagram"] == {"interval_hours": 5, "initial_delay_hours": 0}
+
+
+async def test_fallback_slots_follow_planned_posts_of_same_task(task_agent):
+    """Without the database function, unplanned posts still follow the task's planned posts."""
+    planned_time = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=2)
+    task = make_task(scheduled_times=[planned_time.isoformat()])
+    task_agent.posts_repo.create_many_scheduled = AsyncMock(return_value=None)
+    task_agent.posts_repo.get_latest_scheduled_time = AsyncMock(return_value=None)
+
+    posts = await task_agent.create_content_for_task(str(task.id), task=task)
+
+    assert instagram_times(posts) == {"second": planned_time, "third": planned_time + timedelta(hours=5)}
+    facebook_third = next(post for post in posts if post["platform"] == "facebook" and post["text"].startswith("third"))
+    assert datetime.fromisoformat(facebook_third["scheduled_posting_time"]) == planned_time + timedelta(hours=5, minutes=30)
+    task_agent.posts_repo.create_many.assert_awaited_once()
+
+
+async def test_unbudgeted_task_is_marked_failed_once(task_agent):
+    """A task with media posts but no budget is written failed once, with its reason."""
+    task = make_task(image_budget=0)
+
+    with pytest.raises(TaskFailedError):
+        await task_agent.create_content_for_task(str(task.id), task=task)
+
+    task_agent.tasks_repo.update.assert_awaited_once_with(
+        BUSINESS_ASSET_ID,
+        str(task.id),
+        {"status": "failed", "error_message": "Task requires media posts but has no image or video budget"}
+    )
+    task_agent.agent_executor.ainvoke.assert_not_awaited()
+
+
+async def test_orphaned_task_is_marked_failed_once(task_agent):
+    task = make_task()
+    task_agent._seed_fetchers["ungrounded"] = AsyncMock(return_value=None)
+
+    with pytest.raises(TaskFailedError, match="no longer exists"):
+        await task_agent.create_content_for_task(str(task.id), task=task)
+
+    [call] = task_agent.tasks_repo.update.await_args_list
+    assert call.args[2]["status"] == "failed"
+    assert "no longer exists" in call.args[2]["error_message"]
+
+
+@pytest.fixture
+def fallback_agent(agent, postgrest):
+    """Agent computing fallback slots from a real CompletedPostRepository."""
+    agent.posts_repo = CompletedPostRepository()
+    agent._schedule_cursor = {}
+    return agent
+
+
+async def test_calculate_scheduled_time_falls_back_to_local_cursor(fallback_agent, postgrest):
+    """The latest pending post is read once and the cursor advances in memory."""
+    latest = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+    postgrest.respond("/completed_posts", json=[{"scheduled_posting_time": latest.isoformat()}])
+
+    first = await fallback_agent._calculate_scheduled_time("instagram")
+    second = await fallback_agent._calculate_scheduled_time("instagram")
+
+    assert first == latest + timedelta(hours=5)
+    assert second == latest + timedelta(hours=10)
+    assert len(postgrest.calls("/completed_posts")) == 1
+
+
+@pytest.mark.parametrize("rows", [
+    [],
+    [{"scheduled_posting_time": "2020-01-01T10:00:00+00:00"}],
+])
+async def test_calculate_scheduled_time_fallback_starts_from_now(fallback_agent, postgrest, rows):
+    """With no pending posts, or only stale ones, the fallback schedules from now."""
+    postgrest.respond("/completed_posts", json=rows)
+    before = datetime.now(timezone.utc)
+
+    scheduled = await fallback_agent._calculate_scheduled_time("facebook")
+
+    assert before <= scheduled <= datetime.now(timezone.utc)
+
+
+def test_wavespeed_semaphores_work_across_event_loops(monkeypatch):
+    """Each event loop gets its own caps, shared within the loop, so contended waits don't fail."""
+    monkeypatch.setattr(settings, "wavespeed_max_concurrent_images", 1)
+
+    async def contend():
+        async def generate():
+            image_semaphore, _ = _get_wavespeed_semaphores()
+            async with image_semaphore:
+                await asyncio.sleep(0)
+        await asyncio.gather(generate(), generate())
+        return _get_wavespeed_semaphores()
+
+    first = asyncio.run(contend())
+    second = asyncio.run(contend())
+
+    assert first[0] is not second[0]
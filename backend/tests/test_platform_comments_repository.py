@@ -0,0 +1,74 @@
+# backend/tests/test_platform_comments_repository.py
+
+"""
+Unit tests for batched comment status updates on PlatformCommentRepository.
+Runs the real PostgREST client against a stubbed transport.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.database.repositories.platform_comments import PlatformCommentRepository
+
+BUSINESS_ASSET_ID = "test-asset"
+RPC_PATH = "/rpc/apply_comment_status_updates"
+
+
+@pytest.fixture
+def updates():
+    return [
+        {
+            "id": uuid4(),
+            "status": "responded",
+            "response_text": "Thanks!",
+            "response_comment_id": "reply-1",
+            "responded_at": "2030-01-01T10:00:00+00:00"
+        },
+        {"id": uuid4(), "status": "failed", "error_message": "Failed to post response", "retry_increment": 1},
+        {"id": uuid4(), "status": "ignored"},
+    ]
+
+
+async def test_apply_status_updates_uses_one_rpc_call(postgrest, updates):
+    postgrest.respond(RPC_PATH, json=[{"id": str(update["id"])} for update in updates])
+
+    assert await PlatformCommentRepository().apply_status_updates(BUSINESS_ASSET_ID, updates) == 3
+
+    [(_, _, _, body)] = postgrest.calls(RPC_PATH)
+    payload = json.loads(body)["p_updates"]
+    assert [item["id"] for item in payload] == [str(update["id"]) for update in updates]
+    assert all(item["business_asset_id"] == BUSINESS_ASSET_ID for item in payload)
+
+
+async def test_apply_status_updates_falls_back_to_individual_updates(postgrest, updates):
+    """When the RPC fails, every collected update is applied once through mark_as_*."""
+    postgrest.respond(RPC_PATH, status_code=404, json={
+        "code": "PGRST202",
+        "message": "Could not find the function public.apply_comment_status_updates"
+    })
+    repo = PlatformCommentRepository()
+    repo.mark_as_responded = AsyncMock(return_value=MagicMock())
+    repo.mark_as_failed = AsyncMock(return_value=MagicMock())
+    repo.mark_as_ignored = AsyncMock(return_value=None)
+    responded, failed, ignored = updates
+
+    updated = await repo.apply_status_updates(BUSINESS_ASSET_ID, updates)
+
+    repo.mark_as_responded.assert_awaited_once_with(
+        business_asset_id=BUSINESS_ASSET_ID,
+        comment_record_id=responded["id"],
+        response_text="Thanks!",
+        response_comment_id="reply-1"
+    )
+    repo.mark_as_failed.assert_awaited_once_with(
+        business_asset_id=BUSINESS_ASSET_ID,
+        comment_record_id=failed["id"],
+        error_message="Failed to post response",
+        increment_retry=True
+    )
+    repo.mark_as_ignored.assert_awaited_once_with(BUSINESS_ASSET_ID, ignored["id"])
+    # Only updates whose record was found are counted
+    assert updated == 2
@@ -0,0 +1,31 @@
+# backend/tests/test_storage.py
+
+"""
+Unit tests for StorageService uploads.
+Runs uploads through the real storage3 client with a stubbed HTTP transport.
+"""
+
+import tempfile
+
+from backend.services.supabase.storage import StorageService
+
+
+async def test_upload_media_bytes(storage_uploads):
+    """Bytes are sent as the multipart file body."""
+    url = await StorageService().upload_media("ai-generated/images/test.png", b"png-bytes", "image/png")
+
+    assert url == "http://storage.test/storage/v1/object/public/generated-media/ai-generated/images/test.png"
+    assert len(storage_uploads) == 1
+    assert b"png-bytes" in storage_uploads[0]
+
+
+async def test_upload_media_streams_temp_file(storage_uploads):
+    """A temp file reopened read-only is streamed rather than treated as a path."""
+    with tempfile.TemporaryFile() as media_file:
+        media_file.write(b"video-bytes")
+        media_file.seek(0)
+        with open(media_file.fileno(), "rb", closefd=False) as upload_file:
+            await StorageService().upload_media("ai-generated/videos/test.mp4", upload_file, "video/mp4")
+
+    assert len(storage_uploads) == 1
+    assert b"video-bytes" in storage_uploads[0]
@@ -7,6 +7,7 @@ from .exceptions import (
     APIError,
     ValidationError,
     AgentError,
+    TaskFailedError,
     GuardrailViolationError,
     MediaGenerationError,
     PublishingError,
@@ -20,6 +21,7 @@ __all__ = [
     "APIError",
     "ValidationError",
     "AgentError",
+    "TaskFailedError",
     "GuardrailViolationError",
     "MediaGenerationError",
     "PublishingError",
@@ -65,6 +65,11 @@ class AgentError(SocialMediaFrameworkError):
         return msg
 
 
+class TaskFailedError(AgentError):
+    """Raised after a task has already been marked failed with its reason."""
+    pass
+
+
 class GuardrailViolationError(ValidationError):
     """Raised when planner output violates guardrails."""
 